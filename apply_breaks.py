@@ -8,6 +8,17 @@ according to the weighted distribution rules defined in the break length ruleset
 Usage:
     python3 apply_breaks.py [input_file] [output_file]
     python3 apply_breaks.py --sign <Sign> [input_file]
+    python3 apply_breaks.py --chunks [--max-chunk-chars N] [--max-chunk-seconds S] [input_file] [output_file]
+    python3 apply_breaks.py --chunk-only <with_breaks_file> [manifest.json]
+    python3 apply_breaks.py --incremental <previous_with_breaks> [edited_input] [output_file]
+
+Every run also writes timeline__<output stem>.json next to the output: character and
+estimated time offsets for first-time card reveals, reactions and extended
+breaks, so sound effects can be placed without re-parsing the text.
+
+--incremental re-breaks an edited reading against its previous with-breaks
+version: unchanged sentences keep their exact breaks, and the chunk manifest
+marks which TTS chunks need re-synthesis (output defaults to the previous file).
 
 If no arguments provided, defaults to:
     input:  ./output/FULL_READING.txt
@@ -16,8 +27,10 @@ If no arguments provided, defaults to:
 
 import re
 import random
-import argparse
+import hashlib
+import json
 import os
+import tempfile
 from pathlib import Path
 from datetime import datetime
 
@@ -64,12 +77,31 @@ def get_random_break_duration():
     # Fallback to micro break
     return round(random.uniform(0.5, 2.0), 1)
 
+# Card reveal ("The Emperor, upright.") and short reaction ("Oh wow.") building blocks
+CARD_REVEAL_PATTERN = (
+    r'(?:The|Ace|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|Page|Knight|Queen|King)\s+(?:of\s+)?'
+    r'(?:Wands|Cups|Swords|Pentacles|Fool|Magician|High Priestess|Empress|Emperor|Hierophant|Lovers|Chariot|Strength|Hermit|Wheel of Fortune|Justice|Hanged Man|Death|Temperance|Devil|Tower|Star|Moon|Sun|Judgement|World)'
+    r'(?:,\s+(?:reversed|upright))?\.'
+)
+REACTION_PATTERN = r'(?:Oh wow|Huh\?\?|Sheesh|Whoa|Oh my god|Mm-hm|Hm|Mmm)\.'
+REACTION_SENTENCE_RE = re.compile(rf'^(?:{REACTION_PATTERN}|Hmm\.)$', re.IGNORECASE)
+
+# Pattern 1 of sanitize_break_combinations. Compiled once; every quantified run is
+# followed by a distinct literal, so a failed attempt never backtracks more than
+# the whitespace it consumed (linear overall, see scripts/regex_adversarial.py).
+# The short break stops below 2.5s so the fix's own 2.5-3.5s output never
+# re-matches: sanitizing twice (e.g. rebreak_incremental) leaves breaks alone.
+REVEAL_REACTION_SHORT_BREAK_RE = re.compile(
+    rf'({CARD_REVEAL_PATTERN})(\s*)<break time="((?:[3-9]|1[0-2])(?:\.\d+)?)s"\s*/>(\s*)({REACTION_PATTERN})(\s*)<break time="(?:[01](?:\.\d+)?|2(?:\.[0-4]\d*)?)s"\s*/>',
+    re.IGNORECASE
+)
+
 def sanitize_break_combinations(text):
     """
     Sanitize problematic break combinations that cause TTS artifacts.
     
     Known Issues:
-    1. Card reveal + medium/long break (3s+) + reaction ("Oh wow", etc) + short break (1-2s)
+    1. Card reveal + medium/long break (3s+) + reaction ("Oh wow", etc) + short break (under 2.5s)
        → Causes glitches after the reaction
        → Fix: Adjust post-reaction break to 2.5-3.5s range
     
@@ -80,23 +112,20 @@ def sanitize_break_combinations(text):
     # Example: "The Emperor, upright. <break time="3.8s" /> Oh wow. <break time="1.1s" />"
     # Fix: Change the break after "Oh wow." to 2.5-3.5s to avoid artifacts
     
-    pattern1 = re.compile(
-        r'((?:The|Ace|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|Page|Knight|Queen|King)\s+(?:of\s+)?(?:Wands|Cups|Swords|Pentacles|Fool|Magician|High Priestess|Empress|Emperor|Hierophant|Lovers|Chariot|Strength|Hermit|Wheel of Fortune|Justice|Hanged Man|Death|Temperance|Devil|Tower|Star|Moon|Sun|Judgement|World)(?:,\s+(?:reversed|upright))?\.)\s*<break time="([3-9]|1[0-2])(?:\.\d+)?s"\s*/>\s*((?:Oh wow|Huh\?\?|Sheesh|Whoa|Oh my god|Mm-hm|Hm|Mmm)\.)\s*<break time="([0-2])(?:\.\d+)?s"\s*/>',
-        re.IGNORECASE
-    )
+    # Every match contains two break tags; skip the alternation scan when that's impossible
+    if text.count('<break') < 2:
+        return text
     
     def replace_pattern1(match):
-        card_reveal = match.group(1)
-        first_break_time = match.group(2)
-        reaction = match.group(3)
-        problematic_break_time = match.group(4)
+        card_reveal, ws1, first_break_time, ws2, reaction, ws3 = match.group(1, 2, 3, 4, 5, 6)
         
         # Replace the short problematic break with a safer 2.5-3.5s break
         safe_break = round(random.uniform(2.5, 3.5), 1)
         
-        return f'{card_reveal} <break time="{first_break_time}s" /> {reaction} <break time="{safe_break}s" />'
+        # Keep the original whitespace: the match may span a paragraph break
+        return f'{card_reveal}{ws1}<break time="{first_break_time}s" />{ws2}{reaction}{ws3}<break time="{safe_break}s" />'
     
-    text = pattern1.sub(replace_pattern1, text)
+    text = REVEAL_REACTION_SHORT_BREAK_RE.sub(replace_pattern1, text)
     
     # Add more patterns here as discovered during QC
     # Pattern 2: [Future pattern]
@@ -151,8 +180,68 @@ def split_header(text: str):
     return '', text
 
 
-def add_breaks_to_text(text):
-    """Add break tags throughout the text according to the ruleset."""
+# First mention of a card (once per reading) gets a pre-reveal pause
+CARD_MENTION_RE = re.compile(
+    r'The\s+(?:Ace|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|Page|Knight|Queen|King)\s+of\s+(?:Wands|Cups|Swords|Pentacles)|The\s+(?:Fool|Magician|High Priestess|Empress|Emperor|Hierophant|Lovers|Chariot|Strength|Hermit|Wheel of Fortune|Justice|Hanged Man|Death|Temperance|Devil|Tower|Star|Moon|Sun|Judgement|World)(?:,\s+(?:reversed|upright))?',
+    re.IGNORECASE
+)
+REALIZATION_RE = re.compile(r'^(Wait|Hold up|Hold on|I\'m seeing|Hm|Mm)', re.IGNORECASE)
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _reveal_anchor(sentence, card_match, pre_card_tag, pause):
+    """Timeline anchor for a first-time card reveal preceded by pre_card_tag."""
+    card_name = card_match.group(0).lower()
+    card_title = re.sub(r',\s*(?:reversed|upright)$', '', card_match.group(0), flags=re.IGNORECASE)
+    return {
+        'type': 'card_reveal',
+        'card': card_title[0].upper() + card_title[1:],
+        'reversed': 'reversed' in card_name
+                    or bool(re.match(r',?\s*reversed', sentence[card_match.end():], re.IGNORECASE)),
+        'pause_seconds': pause,
+        'needle': f'{pre_card_tag} {sentence}',
+        # offset of the card name inside the needle (tag + space + words before it)
+        'lead': len(pre_card_tag) + 1 + card_match.start(),
+        'speech_lead': len(pre_card_tag) + 1,
+    }
+
+def _pre_sentence_tags(sentence, revealed_cards):
+    """Break tags that go before sentence, plus its card_reveal anchor (or None).
+
+    Adds the card to revealed_cards on its first mention.
+    """
+    tags = []
+    # Check if this sentence starts with a realization phrase
+    if REALIZATION_RE.match(sentence):
+        # Add pre-realization pause (0.5-1 second)
+        pre_pause = round(random.uniform(0.5, 1.0), 1)
+        tags.append(f'<break time="{pre_pause}s" />')
+
+    # Check for first-time card reveal
+    card_match = CARD_MENTION_RE.search(sentence)
+    if card_match:
+        card_name = card_match.group(0).lower()
+        # Only add pre-card pause if this is the first time we see this card
+        if card_name not in revealed_cards:
+            revealed_cards.add(card_name)
+            # Add pre-card-reveal pause (2-5 seconds) - expanded range for card flip sound insertion
+            pre_card_pause = round(random.uniform(2.0, 5.0), 1)
+            pre_card_tag = f'<break time="{pre_card_pause}s" />'
+            tags.append(pre_card_tag)
+            return tags, _reveal_anchor(sentence, card_match, pre_card_tag, pre_card_pause)
+    return tags, None
+
+def _post_sentence_tag(sentence, index, total_sentences):
+    """Break tag after sentence, or None (never after the paragraph's last sentence)."""
+    if index < total_sentences - 1 and should_add_break_after_sentence(sentence, index, total_sentences):
+        return f'<break time="{get_random_break_duration()}s" />'
+    return None
+
+def add_breaks_to_text(text, timeline=None):
+    """Add break tags throughout the text according to the ruleset.
+
+    If a list is passed as timeline, it is filled with card-reveal, reaction and
+    extended-break events (see build_timeline) for sound-effect mixing.
+    """
     # Preserve header if present
     header, body = split_header(text)
 
@@ -164,6 +253,8 @@ def add_breaks_to_text(text):
     
     # Track card names that have been revealed (for first-time reveal detection)
     revealed_cards = set()
+    # Ordered text anchors for the timeline; resolved to offsets after sanitization
+    anchors = []
     
     # Split into paragraphs first to preserve structure
     paragraphs = body.split('\n\n')
@@ -175,40 +266,27 @@ def add_breaks_to_text(text):
             continue
             
         # Split into sentences for analysis within each paragraph
-        sentences = re.split(r'(?<=[.!?])\s+', paragraph.strip())
+        sentences = SENTENCE_SPLIT_RE.split(paragraph.strip())
         
         result_sentences = []
+        prev_reveal = None
         
         for i, sentence in enumerate(sentences):
-            # Check if this sentence starts with a realization phrase
-            realization_match = re.match(r'^(Wait|Hold up|Hold on|I\'m seeing|Hm|Mm)', sentence, re.IGNORECASE)
-            if realization_match:
-                # Add pre-realization pause (0.5-1 second)
-                pre_pause = round(random.uniform(0.5, 1.0), 1)
-                result_sentences.append(f'<break time="{pre_pause}s" />')
-            
-            # Check for first-time card reveal
-            card_match = re.search(r'The\s+(?:Ace|Two|Three|Four|Five|Six|Seven|Eight|Nine|Ten|Page|Knight|Queen|King)\s+of\s+(?:Wands|Cups|Swords|Pentacles)|The\s+(?:Fool|Magician|High Priestess|Empress|Emperor|Hierophant|Lovers|Chariot|Strength|Hermit|Wheel of Fortune|Justice|Hanged Man|Death|Temperance|Devil|Tower|Star|Moon|Sun|Judgement|World)(?:,\s+(?:reversed|upright))?', sentence, re.IGNORECASE)
-            
-            if card_match:
-                card_name = card_match.group(0).lower()
-                # Only add pre-card pause if this is the first time we see this card
-                if card_name not in revealed_cards:
-                    revealed_cards.add(card_name)
-                    # Add pre-card-reveal pause (2-5 seconds) - expanded range for card flip sound insertion
-                    pre_card_pause = round(random.uniform(2.0, 5.0), 1)
-                    result_sentences.append(f'<break time="{pre_card_pause}s" />')
+            tags, reveal = _pre_sentence_tags(sentence, revealed_cards)
+            result_sentences.extend(tags)
+            if reveal is not None:
+                anchors.append(reveal)
+            elif prev_reveal is not None and REACTION_SENTENCE_RE.match(sentence):
+                anchors.append({'type': 'reaction', 'card': prev_reveal['card'],
+                                'reaction': sentence, 'needle': sentence, 'lead': 0})
+            prev_reveal = reveal
             
             result_sentences.append(sentence)
             
-            # Skip adding breaks after the last sentence
-            if i < len(sentences) - 1:
-                # Determine if we should add a break after this sentence
-                should_add_break = should_add_break_after_sentence(sentence, i, len(sentences))
-                
-                if should_add_break:
-                    duration = get_random_break_duration()
-                    result_sentences.append(f'<break time="{duration}s" />')
+            # Determine if we should add a break after this sentence
+            post = _post_sentence_tag(sentence, i, len(sentences))
+            if post:
+                result_sentences.append(post)
         
         # Join sentences within paragraph with single spaces
         processed_paragraph = ' '.join(result_sentences)
@@ -220,8 +298,52 @@ def add_breaks_to_text(text):
     # Apply sanitization to fix problematic break combinations
     processed_body = sanitize_break_combinations(processed_body)
     
+    if timeline is not None:
+        timeline.extend(build_timeline(header + processed_body, anchors))
+    
     return header + processed_body
 
+def build_timeline(text, anchors):
+    """Resolve ordered anchors plus extended breaks to character and estimated time offsets.
+
+    Anchors are located with a forward-only cursor and the time estimate is
+    accumulated segment by segment, so the whole pass is linear in len(text).
+    card_reveal events carry pause_start (where the pre-card break begins, i.e.
+    where the flip sound goes) and time_offset (when the card name is spoken).
+    """
+    located = []
+    cursor = 0
+    for a in anchors:
+        pos = text.find(a['needle'], cursor)
+        if pos < 0:
+            continue
+        cursor = pos + len(a['needle'])
+        located.append((pos, a))
+    extended_min = BREAK_RANGES['extended']['range'][0]
+    for m in BREAK_TAG_RE.finditer(text):
+        seconds = float(m.group(1))
+        if seconds >= extended_min:
+            located.append((m.start(), {'type': 'extended_break', 'seconds': seconds, 'lead': 0}))
+    located.sort(key=lambda x: x[0])
+
+    events = []
+    elapsed = 0.0
+    last = 0
+    for pos, a in located:
+        elapsed += estimate_speech_seconds(text[last:pos])
+        last = pos
+        event = {k: v for k, v in a.items() if k not in ('needle', 'lead', 'speech_lead')}
+        if a['type'] == 'card_reveal':
+            lead_in = estimate_speech_seconds(text[pos + a['speech_lead']:pos + a['lead']])
+            event['pause_start'] = round(elapsed, 2)
+            event['char_offset'] = pos + a['lead']
+            event['time_offset'] = round(elapsed + a['pause_seconds'] + lead_in, 2)
+        else:
+            event['char_offset'] = pos
+            event['time_offset'] = round(elapsed, 2)
+        events.append(event)
+    return events
+
 def should_add_break_after_sentence(sentence, index, total_sentences):
     """Determine if a break should be added after this sentence."""
     sentence = sentence.strip()
@@ -252,8 +374,41 @@ def should_add_break_after_sentence(sentence, index, total_sentences):
     
     return False
 
+def atomic_write(path, content):
+    """Write text via a temp file + os.replace in the same directory."""
+    out_dir = os.path.dirname(str(path)) or '.'
+    os.makedirs(out_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + os.path.basename(str(path)) + '.', suffix='.tmp', dir=out_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+# Sidecars are named <kind>__<stem>.json, never <stem>.<kind>.json: a sidecar must not
+# share its reading's FULL_READING_with_breaks__<sign>__ prefix, which the web
+# download resolves to the newest file by mtime.
+SIDECAR_KINDS = ('timeline', 'chunks')
+
+def _sidecar_path(output_file, kind):
+    p = Path(output_file)
+    return str(p.with_name(f'{kind}__{p.stem}.json'))
+
+def sidecar_paths(output_file, legacy=True):
+    """Every sidecar name output_file can have (plus the old <stem>.<kind>.json names when legacy)."""
+    paths = [_sidecar_path(output_file, kind) for kind in SIDECAR_KINDS]
+    if legacy:
+        paths += [str(Path(output_file).with_suffix('')) + f'.{kind}.json' for kind in SIDECAR_KINDS]
+    return paths
+
+def timeline_path(output_file):
+    return _sidecar_path(output_file, 'timeline')
+
 def apply_breaks_to_file(input_file, output_file):
-    """Apply break tags to the input file and save to output file."""
+    """Apply break tags to the input file and save to output file; returns output_file."""
     print(f"Reading input file: {input_file}")
     
     if not os.path.exists(input_file):
@@ -266,7 +421,8 @@ def apply_breaks_to_file(input_file, output_file):
     
     # Apply break tags
     print("Applying break tags according to ruleset...")
-    processed_content = add_breaks_to_text(content)
+    timeline = []
+    processed_content = add_breaks_to_text(content, timeline)
     
     print(f"Processed content length: {len(processed_content)} characters")
     
@@ -274,17 +430,24 @@ def apply_breaks_to_file(input_file, output_file):
     break_count = len(re.findall(r'<break time="[^"]+"\s*/>', processed_content))
     print(f"Added {break_count} break tags")
     
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    # Write output file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(processed_content)
+    # Write output file atomically so concurrent readers never see a partial file
+    atomic_write(output_file, processed_content)
     
     print(f"Break tags applied and saved to: {output_file}")
     
+    # Sidecar timeline for sound-effect mixing (card flips, reactions, extended breaks)
+    timeline_file = timeline_path(output_file)
+    atomic_write(timeline_file, json.dumps({
+        'source': str(output_file),
+        'words_per_second': SPEECH_WORDS_PER_SECOND,
+        'events': timeline,
+    }, indent=2, ensure_ascii=False))
+    reveals = sum(1 for e in timeline if e['type'] == 'card_reveal')
+    print(f"Timeline: {reveals} card reveals, {len(timeline)} events → {timeline_file}")
+    
     # Print break distribution summary
     print_break_distribution(processed_content)
+    return output_file
 
 def print_break_distribution(content):
     """Print a summary of the break distribution."""
@@ -323,6 +486,362 @@ def print_break_distribution(content):
     print(f"  Extended breaks (10-12s): {extended_breaks} ({extended_breaks/total_breaks*100:.1f}%)")
     print(f"  Total breaks: {total_breaks}")
 
+# ---------------------------------------------
+# TTS chunking (parallel synthesis / re-render)
+# ---------------------------------------------
+# Chunks are cut only right after a break tag or at a paragraph boundary, never
+# inside a card reveal + reaction sequence (the combination that
+# sanitize_break_combinations tunes for TTS). Concatenating chunk texts in order
+# reproduces the input exactly, so one chunk can be re-rendered in isolation.
+
+SPEECH_WORDS_PER_SECOND = 150 / 60  # ~150 WPM narration
+DEFAULT_CHUNK_MAX_CHARS = 2500
+DEFAULT_CHUNK_MAX_SECONDS = 180.0
+
+BREAK_TAG_RE = re.compile(r'<break time="([\d.]+)s"\s*/>')
+PROTECTED_REVEAL_RE = re.compile(
+    rf'{CARD_REVEAL_PATTERN}\s*<break time="[\d.]+s"\s*/>\s*(?:{REACTION_PATTERN}|Hmm\.)(?:\s*<break time="[\d.]+s"\s*/>)?',
+    re.IGNORECASE
+)
+
+def estimate_speech_seconds(text):
+    """Estimated narration time: spoken words at SPEECH_WORDS_PER_SECOND plus break durations."""
+    pauses = sum(float(t) for t in BREAK_TAG_RE.findall(text))
+    words = len(BREAK_TAG_RE.sub(' ', text).split())
+    return words / SPEECH_WORDS_PER_SECOND + pauses
+
+def _chunk_cut_points(text):
+    """Offsets where a chunk may end: after break tags and paragraph gaps, outside protected reveals."""
+    protected = [(m.start(), m.end()) for m in PROTECTED_REVEAL_RE.finditer(text)]
+    cuts = {m.end() for m in BREAK_TAG_RE.finditer(text)}
+    cuts.update(m.end() for m in re.finditer(r'\n\n+', text))
+    cuts.add(len(text))
+    # Both lists are sorted and spans don't overlap: drop cuts inside spans in one merge pass
+    allowed, k = [], 0
+    for c in sorted(cuts):
+        while k < len(protected) and protected[k][1] <= c:
+            k += 1
+        if k < len(protected) and protected[k][0] < c:
+            continue
+        allowed.append(c)
+    return allowed
+
+def _make_chunk(text, index, start, end, seconds, max_chars, max_seconds):
+    piece = text[start:end]
+    return {
+        'index': index,
+        'start': start,
+        'end': end,
+        'chars': len(piece),
+        'estimated_seconds': round(seconds, 1),
+        'oversized': len(piece) > max_chars or seconds > max_seconds,
+        'sha1': hashlib.sha1(piece.encode('utf-8')).hexdigest(),
+        'text': piece,
+    }
+
+def chunk_for_tts(text, max_chars=DEFAULT_CHUNK_MAX_CHARS, max_seconds=DEFAULT_CHUNK_MAX_SECONDS):
+    """Split with-breaks text into ordered chunks under max_chars / max_seconds where possible.
+
+    Durations are prefix sums over the spans between cut points, so packing is a
+    single forward pass over the cuts.
+    """
+    offsets = [0] + _chunk_cut_points(text)
+    elapsed = [0.0]
+    for prev, cur in zip(offsets, offsets[1:]):
+        elapsed.append(elapsed[-1] + estimate_speech_seconds(text[prev:cur]))
+
+    spans = []  # (start_idx, end_idx) into offsets
+    i = 0
+    while offsets[i] < len(text):
+        best = i + 1  # if nothing fits, take the nearest cut and flag the chunk oversized
+        j = i + 2
+        while j < len(offsets) and offsets[j] - offsets[i] <= max_chars and elapsed[j] - elapsed[i] <= max_seconds:
+            best = j
+            j += 1
+        spans.append((i, best))
+        i = best
+
+    # Whitespace-only spans fold into a neighbour so chunk texts still reassemble the input
+    merged = []  # (start_idx, end_idx, blank)
+    for a, b in spans:
+        blank = not text[offsets[a]:offsets[b]].strip()
+        if merged and (blank or merged[-1][2]):
+            merged[-1] = (merged[-1][0], b, blank and merged[-1][2])
+        else:
+            merged.append((a, b, blank))
+
+    return [
+        _make_chunk(text, n, offsets[a], offsets[b], elapsed[b] - elapsed[a], max_chars, max_seconds)
+        for n, (a, b, blank) in enumerate(merged)
+        if not blank
+    ]
+
+def write_chunk_manifest(text, manifest_file, source=None,
+                         max_chars=DEFAULT_CHUNK_MAX_CHARS, max_seconds=DEFAULT_CHUNK_MAX_SECONDS):
+    """Chunk text and write the ordered JSON manifest; returns the chunk list."""
+    chunks = chunk_for_tts(text, max_chars, max_seconds)
+    manifest = {
+        'source': str(source) if source else None,
+        'max_chars': max_chars,
+        'max_seconds': max_seconds,
+        'words_per_second': SPEECH_WORDS_PER_SECOND,
+        'total_estimated_seconds': round(sum(c['estimated_seconds'] for c in chunks), 1),
+        'chunks': chunks,
+    }
+    atomic_write(manifest_file, json.dumps(manifest, indent=2, ensure_ascii=False))
+    oversized = sum(1 for c in chunks if c['oversized'])
+    print(f"Wrote {len(chunks)} TTS chunks (~{manifest['total_estimated_seconds']}s total"
+          f"{f', {oversized} oversized' if oversized else ''}) to: {manifest_file}")
+    return chunks
+
+def chunk_manifest_path(output_file):
+    return _sidecar_path(output_file, 'chunks')
+
+# -------------------------
+# Incremental re-break
+# -------------------------
+# After QC edits a few sentences, re-breaking the whole reading re-randomizes
+# every pause and invalidates an already reviewed TTS render. Instead the edited
+# text is aligned with the previous with-breaks version paragraph by paragraph,
+# then sentence by sentence. The break tags between two sentences (a "gap") are
+# kept when both neighbours are unchanged and still adjacent; only gaps touching
+# an edit are rebuilt with the same rules as add_breaks_to_text. A kept gap is
+# also rebuilt when a sentence's first-reveal status changes, so card-flip
+# pauses follow the edited reading's revealed_cards order.
+
+def _norm(sentence):
+    return ' '.join(sentence.split())
+
+def _parse_broken_paragraph(paragraph):
+    """Split a with-breaks paragraph into sentences and the tag gaps around them.
+
+    Returns (sentences, gaps) with len(gaps) == len(sentences) + 1: gaps[k] holds
+    the tags before sentence k and gaps[-1] any trailing tags.
+    """
+    sentences, gaps, pos = [], [[]], 0
+    for m in list(BREAK_TAG_RE.finditer(paragraph)) + [None]:
+        seg = paragraph[pos:m.start() if m else len(paragraph)].strip()
+        for sentence in (SENTENCE_SPLIT_RE.split(seg) if seg else []):
+            sentences.append(sentence)
+            gaps.append([])
+        if m:
+            gaps[-1].append(m.group(0))
+            pos = m.end()
+    return sentences, gaps
+
+def _first_reveals(sentence_lists):
+    """Per sentence, the card name it reveals for the first time (or None), in reading order."""
+    revealed, out = set(), []
+    for sentences in sentence_lists:
+        flags = []
+        for sentence in sentences:
+            m = CARD_MENTION_RE.search(sentence)
+            name = m.group(0).lower() if m else None
+            flags.append(name if name and name not in revealed else None)
+            if name:
+                revealed.add(name)
+        out.append(flags)
+    return out
+
+def _pair_paragraphs(old_keys, new_keys):
+    """Map new paragraph index -> old paragraph index (or None) using a paragraph-level diff."""
+    import difflib
+
+    pairs = [None] * len(new_keys)
+    matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op in ('equal', 'replace'):
+            # replaced blocks pair up positionally; extra new paragraphs are rebuilt from scratch
+            for k in range(min(i2 - i1, j2 - j1)):
+                pairs[j1 + k] = i1 + k
+    return pairs
+
+def rebreak_incremental(edited_text, previous_with_breaks, timeline=None):
+    """Re-apply breaks to edited_text, reusing previous_with_breaks wherever the text is unchanged.
+
+    Returns (text, stats) where stats counts paragraphs/sentences touched and
+    gaps rebuilt. Break tags in edited_text are ignored; edit the plain reading.
+    If a list is passed as timeline, it is filled as in add_breaks_to_text.
+    """
+    import difflib
+
+    header, body = split_header(edited_text)
+    body = re.sub(r'\bHm\.', 'Hmm.', BREAK_TAG_RE.sub(' ', normalize_existing_breaks(body)))
+    _, old_body = split_header(previous_with_breaks)
+
+    old_pars = [_parse_broken_paragraph(p) for p in old_body.split('\n\n')]
+    new_raw = body.split('\n\n')
+    new_sents = [SENTENCE_SPLIT_RE.split(p.strip()) if p.strip() else [] for p in new_raw]
+    pairs = _pair_paragraphs([tuple(_norm(x) for x in s) for s, _ in old_pars],
+                             [tuple(_norm(x) for x in s) for s in new_sents])
+    old_first = _first_reveals([s for s, _ in old_pars])
+    new_first = _first_reveals(new_sents)
+
+    revealed_cards = set()
+    anchors = []
+    stats = {'paragraphs': len(new_raw), 'paragraphs_touched': 0,
+             'sentences': 0, 'sentences_changed': 0, 'gaps_rebuilt': 0}
+    processed_paragraphs = []
+
+    for p_idx, (raw, sentences) in enumerate(zip(new_raw, new_sents)):
+        if not sentences:
+            processed_paragraphs.append(raw)
+            continue
+        o_idx = pairs[p_idx]
+        old_sentences, old_gaps = old_pars[o_idx] if o_idx is not None else ([], [[]])
+
+        # sentence-level alignment inside the paired paragraph: new index -> old index
+        mapping = [None] * len(sentences)
+        matcher = difflib.SequenceMatcher(None, [_norm(x) for x in old_sentences],
+                                          [_norm(x) for x in sentences], autojunk=False)
+        for block in matcher.get_matching_blocks():
+            for k in range(block.size):
+                mapping[block.b + k] = block.a + k
+
+        stats['sentences'] += len(sentences)
+        changed = sum(1 for m in mapping if m is None)
+        stats['sentences_changed'] += changed
+
+        result, prev_reveal, touched = [], None, bool(changed) or len(sentences) != len(old_sentences)
+        for i, sentence in enumerate(sentences):
+            j = mapping[i]
+            keep_gap = (
+                j is not None
+                and (j == 0 if i == 0 else (mapping[i - 1] is not None and mapping[i - 1] == j - 1))
+                and (new_first[p_idx][i] is not None) == (old_first[o_idx][j] is not None)
+            )
+            if keep_gap:
+                result.extend(old_gaps[j])
+                reveal = None
+                if new_first[p_idx][i] is not None:
+                    revealed_cards.add(new_first[p_idx][i])
+                    tag = old_gaps[j][-1] if old_gaps[j] else None
+                    card_match = CARD_MENTION_RE.search(sentence)
+                    if tag and card_match:
+                        reveal = _reveal_anchor(sentence, card_match, tag, float(BREAK_TAG_RE.match(tag).group(1)))
+            else:
+                touched = True
+                stats['gaps_rebuilt'] += 1
+                if i > 0:
+                    post = _post_sentence_tag(sentences[i - 1], i - 1, len(sentences))
+                    if post:
+                        result.append(post)
+                tags, reveal = _pre_sentence_tags(sentence, revealed_cards)
+                result.extend(tags)
+
+            if reveal is not None:
+                anchors.append(reveal)
+            elif prev_reveal is not None and REACTION_SENTENCE_RE.match(sentence):
+                anchors.append({'type': 'reaction', 'card': prev_reveal['card'],
+                                'reaction': sentence, 'needle': sentence, 'lead': 0})
+            prev_reveal = reveal
+            result.append(sentence)
+
+        if mapping[-1] is not None and mapping[-1] == len(old_sentences) - 1:
+            result.extend(old_gaps[-1])
+        stats['paragraphs_touched'] += touched
+        processed_paragraphs.append(' '.join(result))
+
+    processed_body = sanitize_break_combinations('\n\n'.join(processed_paragraphs))
+    if timeline is not None:
+        timeline.extend(build_timeline(header + processed_body, anchors))
+    return header + processed_body, stats
+
+def rechunk_incremental(text, previous_chunks, max_chars=DEFAULT_CHUNK_MAX_CHARS,
+                        max_seconds=DEFAULT_CHUNK_MAX_SECONDS):
+    """Chunk text while reusing previous chunks that still appear verbatim, in order.
+
+    Only the stretches between reused chunks are re-chunked, so an edit does not
+    shift every later boundary. Each chunk gets reused=True/False; reused chunks
+    keep their sha1, so their existing audio can be kept.
+    """
+    pieces, pos = [], 0  # (start, end, reused)
+    for c in previous_chunks:
+        at = text.find(c['text'], pos)
+        if at < 0:
+            continue
+        if at > pos:
+            pieces.append((pos, at, False))
+        pieces.append((at, at + len(c['text']), True))
+        pos = at + len(c['text'])
+    if pos < len(text):
+        pieces.append((pos, len(text), False))
+
+    spans = []
+    for start, end, reused in pieces:
+        if reused:
+            spans.append([start, end, True])
+            continue
+        if not text[start:end].strip():
+            # whitespace-only stretch: fold into a neighbour, which then needs re-rendering
+            if spans:
+                spans[-1][1], spans[-1][2] = end, False
+            else:
+                spans.append([start, end, False])
+            continue
+        for c in chunk_for_tts(text[start:end], max_chars, max_seconds):
+            spans.append([start + c['start'], start + c['end'], False])
+        if spans and spans[-1][1] < end:
+            spans[-1][1] = end
+    # a leading whitespace-only span folds forward
+    if len(spans) > 1 and not text[spans[0][0]:spans[0][1]].strip():
+        spans[1][0], spans[1][2] = spans[0][0], False
+        spans.pop(0)
+
+    chunks = []
+    for n, (start, end, reused) in enumerate(spans):
+        chunk = _make_chunk(text, n, start, end, estimate_speech_seconds(text[start:end]), max_chars, max_seconds)
+        chunk['reused'] = reused
+        chunks.append(chunk)
+    return chunks
+
+def rebreak_file(input_file, previous_file, output_file,
+                 max_chars=DEFAULT_CHUNK_MAX_CHARS, max_seconds=DEFAULT_CHUNK_MAX_SECONDS):
+    """Incrementally re-break input_file against previous_file; writes output, timeline and chunk manifest.
+
+    Returns the chunk list; chunks with reused=False need re-synthesis.
+    """
+    with open(input_file, 'r', encoding='utf-8') as f:
+        edited = f.read()
+    with open(previous_file, 'r', encoding='utf-8') as f:
+        previous = f.read()
+    previous_chunks = []
+    prev_manifest = chunk_manifest_path(previous_file)
+    if not os.path.exists(prev_manifest):  # manifests written before the sidecar rename
+        prev_manifest = str(Path(previous_file).with_suffix('')) + '.chunks.json'
+    if os.path.exists(prev_manifest):
+        with open(prev_manifest, 'r', encoding='utf-8') as f:
+            previous_chunks = json.load(f).get('chunks', [])
+    else:
+        previous_chunks = chunk_for_tts(previous, max_chars, max_seconds)
+
+    timeline = []
+    text, stats = rebreak_incremental(edited, previous, timeline)
+    chunks = rechunk_incremental(text, previous_chunks, max_chars, max_seconds)
+
+    atomic_write(output_file, text)
+    atomic_write(timeline_path(output_file), json.dumps({
+        'source': str(output_file),
+        'words_per_second': SPEECH_WORDS_PER_SECOND,
+        'events': timeline,
+    }, indent=2, ensure_ascii=False))
+    resynth = [c['index'] for c in chunks if not c['reused']]
+    atomic_write(chunk_manifest_path(output_file), json.dumps({
+        'source': str(output_file),
+        'max_chars': max_chars,
+        'max_seconds': max_seconds,
+        'words_per_second': SPEECH_WORDS_PER_SECOND,
+        'total_estimated_seconds': round(sum(c['estimated_seconds'] for c in chunks), 1),
+        'rebreak': dict(stats, previous=str(previous_file), resynthesize=resynth),
+        'chunks': chunks,
+    }, indent=2, ensure_ascii=False))
+
+    print(f"Re-break: {stats['paragraphs_touched']}/{stats['paragraphs']} paragraphs touched, "
+          f"{stats['sentences_changed']}/{stats['sentences']} sentences changed, {stats['gaps_rebuilt']} gaps rebuilt")
+    print(f"Re-synthesize {len(resynth)}/{len(chunks)} chunks: {resynth or 'none'}")
+    print(f"Saved to: {output_file} (+ timeline, chunk manifest)")
+    return chunks
+
 def iso_now() -> str:
     try:
         return datetime.now().astimezone().isoformat(timespec='seconds')
@@ -331,19 +850,64 @@ def iso_now() -> str:
         return dt.utcnow().isoformat(timespec='seconds') + 'Z'
 
 
+def latest_reading_for_sign(sign, output_dir='./output'):
+    """Return the published FULL_READING for sign from output/latest/<sign>.json, if any.
+
+    Falls back to the run dir's copy when the published file is gone (e.g. archived).
+    """
+    pointer = Path(output_dir) / 'latest' / f'{sign}.json'
+    if not pointer.exists():
+        return None
+    data = json.loads(pointer.read_text(encoding='utf-8'))
+    rel = data.get('artifacts', {}).get('FULL_READING.txt')
+    candidates = [Path(output_dir) / rel] if rel else []
+    if data.get('run_dir'):
+        candidates.append(Path(output_dir) / data['run_dir'] / 'FULL_READING.txt')
+    found = next((c for c in candidates if c.exists()), None)
+    return str(found) if found else None
+
+
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Apply break tags to tarot reading text')
     parser.add_argument('--sign', dest='sign', help='Zodiac sign for timestamped output naming')
     parser.add_argument('input_file', nargs='?',
-                        default='./output/FULL_READING.txt',
-                        help='Input file path (default: ./output/FULL_READING.txt)')
+                        default=None,
+                        help='Input file path (default: latest reading for --sign, else ./output/FULL_READING.txt)')
     parser.add_argument('output_file', nargs='?',
                         default=None,
                         help='Output file path (default depends on --sign)')
+    parser.add_argument('--chunks', action='store_true',
+                        help='Also write a chunks__<output stem>.json TTS chunk manifest')
+    parser.add_argument('--chunk-only', action='store_true',
+                        help='Input already has breaks: only write its chunk manifest')
+    parser.add_argument('--max-chunk-chars', type=int, default=DEFAULT_CHUNK_MAX_CHARS,
+                        help=f'Max characters per TTS chunk (default: {DEFAULT_CHUNK_MAX_CHARS})')
+    parser.add_argument('--max-chunk-seconds', type=float, default=DEFAULT_CHUNK_MAX_SECONDS,
+                        help=f'Max estimated seconds per TTS chunk (default: {DEFAULT_CHUNK_MAX_SECONDS:g})')
+    parser.add_argument('--incremental', metavar='PREVIOUS',
+                        help='Re-break only edited regions, keeping breaks from this previous with-breaks file')
     
     args = parser.parse_args()
     
     try:
+        input_file = args.input_file
+        if input_file is None:
+            input_file = (latest_reading_for_sign(args.sign) if args.sign else None) or './output/FULL_READING.txt'
+
+        if args.incremental:
+            rebreak_file(input_file, args.incremental, args.output_file or args.incremental,
+                         args.max_chunk_chars, args.max_chunk_seconds)
+            return 0
+
+        if args.chunk_only:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            write_chunk_manifest(text, args.output_file or chunk_manifest_path(input_file), input_file,
+                                 args.max_chunk_chars, args.max_chunk_seconds)
+            return 0
+
         # Determine output path
         output_file = args.output_file
         if output_file is None:
@@ -353,7 +917,12 @@ def main():
             else:
                 output_file = './output/WHITE_SOUL_TAROT_with_breaks.txt'
 
-        apply_breaks_to_file(args.input_file, output_file)
+        apply_breaks_to_file(input_file, output_file)
+        if args.chunks:
+            with open(output_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+            write_chunk_manifest(text, chunk_manifest_path(output_file), output_file,
+                                 args.max_chunk_chars, args.max_chunk_seconds)
         print("\nBreak application completed successfully!")
     except Exception as e:
         print(f"Error: {e}")
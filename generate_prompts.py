@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 # White Soul Tarot — prompt/generation script
 
-# --- Imports (with debug hook) ---
-import os, sys, time, yaml, random, textwrap, datetime, json, re
+# Importing this module has no side effects; yaml, openai and asyncio load on first use.
+import os, sys, time, random, textwrap, datetime, json, re, shutil, string, tempfile, threading
+from contextlib import contextmanager
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed  # NEW
 
-print("[debug] generate_prompts.py starting...", flush=True)
-time.sleep(0.1)
+try:
+    import fcntl
+except ImportError:  # non-POSIX: fall back to a per-process lock
+    fcntl = None
 
 HERE = Path(__file__).parent
 TEMPLATES = HERE / "templates"
@@ -79,9 +81,9 @@ def draw_spread(deck, reversed_prob=0.5):
     
     return chosen
 
-def load_config():
-    cfg_path = HERE / "config.yaml"
-    with open(cfg_path, encoding="utf-8") as f:
+def load_config(cfg_path: Path | str | None = None) -> dict:
+    import yaml
+    with open(cfg_path or HERE / "config.yaml", encoding="utf-8") as f:
         cfg = yaml.safe_load(f)
     return cfg
 
@@ -146,6 +148,42 @@ def draw_clarifier(deck, used_titles, max_clarifiers=2):
 def card_line(card):
     return f"{card}"
 
+# -----------------------------------
+# Prefix-cache-friendly prompt layout
+# -----------------------------------
+# Provider prompt caches match on an exact token prefix. In "prefix_cache" layout
+# every per-run value is replaced by a fixed slot name, so each chapter's long
+# instruction body is byte-identical across runs and signs; the actual spread
+# data goes in a short block at the very end.
+
+PROMPT_SLOTS = {
+    "sign": "<SIGN>",
+    "date_anchor": "<DATE ANCHOR>",
+    "clarifiers": "<SUPPORTING ENERGIES>",
+    **{f"c{i}": f"<CARD {i}>" for i in range(1, 6)},
+    **{f"card{i}_line": f"<CARD {i}>" for i in range(1, 6)},
+}
+PROMPT_SUFFIX_HEADER = "[SPREAD DATA — do not display; fill every <SLOT> above with these values]"
+
+def prompt_layout(cfg):
+    return (os.environ.get("WST_PROMPT_LAYOUT") or str(cfg.get("prompt_layout", "inline"))).lower()
+
+def render_cacheable(tpl: str, values: dict) -> str:
+    """Render tpl as a static slot-only body followed by a compact per-run suffix."""
+    used = []
+    for _, field, _, _ in string.Formatter().parse(tpl):
+        if field and field not in used:
+            used.append(field)
+    static_body = tpl.format(**{k: PROMPT_SLOTS[k] for k in used})
+    # card{n}_line and c{n} share a slot; list each slot once
+    suffix, seen = [PROMPT_SUFFIX_HEADER], set()
+    for k in used:
+        slot = PROMPT_SLOTS[k]
+        if slot not in seen:
+            seen.add(slot)
+            suffix.append(f"{slot} = {values[k]}")
+    return static_body.rstrip() + "\n\n" + "\n".join(suffix) + "\n"
+
 def write_prompt(ch_num, spread, cfg, out_dir):
     # For chapters 2-5, enforce the locked spread
     if ch_num in (2, 3, 4, 5):
@@ -187,37 +225,26 @@ def write_prompt(ch_num, spread, cfg, out_dir):
     }
 
     # --- select template by chapter (7-chapter structure) ---
+    values = dict(c1=c1, c2=c2, c3=c3, c4=c4, c5=c5, clarifiers=clarifiers)
     if ch_num == 1:
-        tpl = (TEMPLATES / "01.txt").read_text(encoding="utf-8")
-        body = tpl.format(
-            c1=c1, c2=c2, c3=c3, c4=c4, c5=c5,
-            clarifiers=clarifiers,
-            sign=sign,
-            date_anchor=date_anchor,
-            card1_line=lines[1],
-        )
+        tpl_name = "01.txt"
+        values.update(sign=sign, date_anchor=date_anchor, card1_line=lines[1])
     elif ch_num in (2, 3, 4, 5):
-        tpl = (TEMPLATES / f"{ch_num:02d}.txt").read_text(encoding="utf-8")
-        body = tpl.format(
-            c1=c1, c2=c2, c3=c3, c4=c4, c5=c5,
-            clarifiers=clarifiers,
-            **{f"card{ch_num}_line": lines[ch_num]},
-        )
+        tpl_name = f"{ch_num:02d}.txt"
+        values[f"card{ch_num}_line"] = lines[ch_num]
     elif ch_num == 6:
-        tpl = (TEMPLATES / "callback.txt").read_text(encoding="utf-8")
-        body = tpl.format(
-            c1=c1, c2=c2, c3=c3, c4=c4, c5=c5,
-            clarifiers=clarifiers,
-        )
+        tpl_name = "callback.txt"
     elif ch_num == 7:
-        tpl = (TEMPLATES / "07.txt").read_text(encoding="utf-8")
-        body = tpl.format(
-            c1=c1, c2=c2, c3=c3, c4=c4, c5=c5,
-            clarifiers=clarifiers,
-        )
+        tpl_name = "07.txt"
     else:
         raise ValueError(f"Chapter {ch_num} is out of range for 7-chapter run.")
 
+    tpl = (TEMPLATES / tpl_name).read_text(encoding="utf-8")
+    if prompt_layout(cfg) == "prefix_cache":
+        body = render_cacheable(tpl, values)
+    else:
+        body = tpl.format(**values)
+
     out_path = out_dir / f"CH{ch_num:02d}_prompt.txt"
     out_path.write_text(body, encoding="utf-8")
     return out_path
@@ -225,23 +252,41 @@ def write_prompt(ch_num, spread, cfg, out_dir):
 # ---------
 # Sanitizer
 # ---------
-CLOSER_RE = re.compile(r"\n+\s*(OK\.|Okay\.|Alright\.)\s*$", re.IGNORECASE)
+# Regexes in this section run on raw model output, so each one is written to stay
+# linear-time on adversarial input (see scripts/regex_adversarial.py): no
+# overlapping quantifiers, and bracket/line scans never cross a newline.
+CLOSER_RE = re.compile(r"(OK\.|Okay\.|Alright\.)\Z", re.IGNORECASE)
+CLOSER_MAX_LEN = len("Alright.")
 
 def sanitize_trailing_closer(text: str) -> str:
+    """Pull a closer ("OK." etc.) stranded on its own final line back onto the previous line."""
     if not text:
         return text
-    return CLOSER_RE.sub(lambda m: " " + m.group(1), text.rstrip())
+    t = text.rstrip()
+    m = CLOSER_RE.search(t, max(0, len(t) - CLOSER_MAX_LEN))
+    if not m:
+        return t
+    head = t[:m.start()]
+    kept = head.rstrip()
+    if "\n" not in head[len(kept):]:
+        return t
+    return kept + " " + m.group(1)
 
 REACTIONS = ["Whoa.", "Hm.", "Huh??", "Oh my God", "Sheesh."]
 
+OH_WOW_RE = re.compile(r'^(?P<cardline>.+?\.)\s+Oh wow\.', flags=re.MULTILINE|re.DOTALL)
+OH_WOW_GUARD_RE = re.compile(r'\.\s+Oh wow\.')
+
 def rotate_oh_wow(text: str) -> str:
-    pat = re.compile(r'^(?P<cardline>.+?\.)\s+Oh wow\.', flags=re.MULTILINE|re.DOTALL)
-    if pat.search(text):
+    # The lazy DOTALL scan is only linear when a match is guaranteed; check cheaply first
+    if OH_WOW_GUARD_RE.search(text):
         replacement = random.choice(REACTIONS)
-        return pat.sub(rf"\g<cardline> {replacement}", text, count=1)
+        return OH_WOW_RE.sub(rf"\g<cardline> {replacement}", text, count=1)
     return text
 
-META_SCRUB_RE = re.compile(r'^\[[A-Z]+:[^\]]*\]\s*$', flags=re.MULTILINE)
+# A [STATE: ...] block may wrap onto following lines; the bounded class keeps the
+# newline-crossing scrub linear when a "[" is never closed
+META_SCRUB_RE = re.compile(r'^\[[A-Z]+:[^\]]{0,2000}\]\s*$', flags=re.MULTILINE)
 
 # ---- Break ruleset post-processor ----
 RANGE_0_2 = [".5s", "0.6s", "1s", "1.7s", "2s"]
@@ -255,8 +300,10 @@ def _bt(tag_seconds: str) -> str:
 def _pick(seq):
     return random.choice(seq)
 
+# Same lines as the old lazy "^[A-Z][^\n]+?(?:, reversed)?\." form (capital, then a
+# period somewhere after the second character) without the lazy backtracking
 CARD_NAME_RE = re.compile(
-    r"^(?:[A-Z][^\n]+?)(?:, reversed)?\.\s*(?:Whoa\.|Hm\.|Huh\?\?|Oh my god,|Sheesh\.)?",
+    r"^[A-Z][^\n][^.\n]*\.\s*(?:Whoa\.|Hm\.|Huh\?\?|Oh my god,|Sheesh\.)?",
     flags=re.MULTILINE
 )
 
@@ -289,8 +336,29 @@ def _apply_paragraph_breaks(text: str, p75_2_5=True) -> str:
         new_paras.append(p.rstrip() + " " + _bt(_pick(cat)))
     return "\n\n".join(new_paras)
 
+def _split_sentences_outside_breaks(text: str) -> list[str]:
+    """Equivalent of re.split(r'(\\. )(?![^<]*</?break)', text) in one pass.
+
+    The lookahead form rescans up to the next '<' for every ". ", which is
+    quadratic on long tag-free text; here the next '<' is found once and reused.
+    """
+    parts, last = [], 0
+    next_lt = -2  # -2: not looked up yet, -1: no '<' left in text
+    i = text.find(". ")
+    while i != -1:
+        after = i + 2
+        if next_lt != -1 and next_lt < after:
+            next_lt = text.find("<", after)
+        if next_lt == -1 or not text.startswith(("<break", "</break"), next_lt):
+            parts.append(text[last:i])
+            parts.append(". ")
+            last = after
+        i = text.find(". ", after)
+    parts.append(text[last:])
+    return parts
+
 def _sprinkle_micro_breaks(text: str, every_n_sentences: int = 5) -> str:
-    parts = re.split(r'(\. )(?![^<]*</?break)', text)
+    parts = _split_sentences_outside_breaks(text)
     if len(parts) < 3:
         return text
     for i in range(0, len(parts)-1, 2*every_n_sentences):
@@ -315,10 +383,11 @@ def sanitize_for_output(src: str, breaks_mode: str = "none") -> str:
 
     # Remove chapter markers like "[CH01] ———" and any underline ruler lines
     s = re.sub(r'^\[CH\d{2}\][^\n]*\n?', '', s, flags=re.MULTILINE)
-    s = re.sub(r'^[\s—-]{3,}\s*$', '', s, flags=re.MULTILINE)
+    s = re.sub(r'^[ \t—-]{3,}$', '', s, flags=re.MULTILINE)
 
-    # Remove bracketed process/log lines like "[child] [debug] ..." or "[ok] ..."
-    s = re.sub(r'^\[[^\]]+\](?:\s+\[[^\]]+\])*\s.*$', '', s, flags=re.MULTILINE)
+    # Remove bracketed process/log lines like "[child] [debug] ...", "[ok] ..." or a bare "[ok]"
+    # (bracket and gap classes stay on one line so an unclosed "[" cannot scan the whole text)
+    s = re.sub(r'^\[[^\]\n]+\](?:[ \t]+\[[^\]\n]+\])*(?:[ \t].*)?$', '', s, flags=re.MULTILINE)
 
     # Optionally remove <break> tags when breaks=none
     if breaks_mode == 'none':
@@ -329,6 +398,449 @@ def sanitize_for_output(src: str, breaks_mode: str = "none") -> str:
 
     return s
 
+# --- token usage / prompt-cache reporting ---
+USAGE_LOG = "usage.jsonl"
+RUN_TIMINGS = "timings.json"
+
+def _usage_field(obj, name, default=0):
+    if obj is None:
+        return default
+    if isinstance(obj, dict):
+        return obj.get(name, default) or default
+    return getattr(obj, name, default) or default
+
+def record_usage(out_dir: Path, ch_num: int, resp) -> dict:
+    """Append prompt/cached/completion token counts for one response to usage.jsonl."""
+    usage = getattr(resp, "usage", None)
+    details = _usage_field(usage, "prompt_tokens_details", None)
+    row = {
+        "chapter": ch_num,
+        "prompt_tokens": _usage_field(usage, "prompt_tokens"),
+        "cached_tokens": _usage_field(details, "cached_tokens"),
+        "completion_tokens": _usage_field(usage, "completion_tokens"),
+    }
+    with (out_dir / USAGE_LOG).open("a", encoding="utf-8") as f:
+        f.write(json.dumps(row) + "\n")
+    pct = 100.0 * row["cached_tokens"] / row["prompt_tokens"] if row["prompt_tokens"] else 0.0
+    print(f"[cache] CH{ch_num:02d} prompt={row['prompt_tokens']} cached={row['cached_tokens']} ({pct:.0f}%)")
+    return row
+
+def summarize_usage(out_dir: Path) -> dict | None:
+    p = out_dir / USAGE_LOG
+    if not p.exists():
+        return None
+    rows = [json.loads(ln) for ln in p.read_text(encoding="utf-8").splitlines() if ln.strip()]
+    total = {k: sum(r.get(k, 0) for r in rows) for k in ("prompt_tokens", "cached_tokens", "completion_tokens")}
+    pct = 100.0 * total["cached_tokens"] / total["prompt_tokens"] if total["prompt_tokens"] else 0.0
+    print(f"[cache] {len(rows)} calls: prompt={total['prompt_tokens']} cached={total['cached_tokens']} "
+          f"({pct:.1f}% hit) completion={total['completion_tokens']}")
+    return total
+
+# --- OpenAI request helpers ---
+SYSTEM_PROMPT = "You are ANGELA for White Soul Tarot 2. Follow the script and tone rules exactly as provided in the prompt text."
+
+def make_client(cfg: dict, api_key: str, async_client: bool = False):
+    import openai
+    cls = openai.AsyncOpenAI if async_client else openai.OpenAI
+    # base_url lets the pipeline run against a local stub (see stub_llm_server.py)
+    base_url = os.environ.get("OPENAI_BASE_URL") or cfg.get("openai_base_url")
+    kwargs = {"api_key": api_key}
+    if base_url:
+        kwargs["base_url"] = base_url
+    if quota_scheduler(cfg) is not None:
+        kwargs["max_retries"] = 0  # retried through the shared quota instead (see _retry_kind)
+    return cls(**kwargs)
+
+def _chat_request(cfg: dict, prompt_text: str) -> dict:
+    req = dict(
+        model=cfg.get("openai_model", "gpt-4o"),  # fallback aligned with your config
+        temperature=float(cfg.get("temperature", 0.6)),
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt_text}
+        ]
+    )
+    if candidate_count(cfg) > 1:
+        req["n"] = candidate_count(cfg)
+    return req
+
+def chat_completion(client, cfg: dict, prompt_text: str):
+    return client.chat.completions.create(**_chat_request(cfg, prompt_text))
+
+async def chat_completion_async(client, cfg: dict, prompt_text: str):
+    return await client.chat.completions.create(**_chat_request(cfg, prompt_text))
+
+# ------------------------------------------------
+# Shared API quota (see quota_scheduler.py)
+# ------------------------------------------------
+# With quota_rpm / quota_tpm set, every request first takes a slot from the
+# host-wide token buckets, so concurrent per-sign runs queue in FIFO order
+# instead of tripping 429s. A 429 that still gets through pauses all processes
+# for its Retry-After and the request is re-queued, up to quota_max_retries.
+
+_QUOTA = {}
+
+def quota_scheduler(cfg: dict):
+    key = (cfg.get("quota_rpm"), cfg.get("quota_tpm"), cfg.get("quota_state_file"), os.environ.get("WST_QUOTA_FILE"))
+    if key not in _QUOTA:
+        from quota_scheduler import QuotaScheduler
+        _QUOTA[key] = QuotaScheduler.from_config(cfg)
+    return _QUOTA[key]
+
+def _retry_after(err, attempt: int) -> float:
+    headers = getattr(getattr(err, "response", None), "headers", None) or {}
+    try:
+        return max(0.5, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return min(60.0, 2.0 ** attempt) + random.uniform(0, 1)
+
+def _retry_kind(err) -> str | None:
+    """"rate" for 429s, "transient" for what the SDK would retry itself (408/409/5xx, connection, timeout)."""
+    import openai
+    if isinstance(err, openai.RateLimitError):
+        return "rate"
+    if isinstance(err, openai.APIConnectionError):  # includes APITimeoutError
+        return "transient"
+    if isinstance(err, openai.APIStatusError) and (err.status_code in (408, 409) or err.status_code >= 500):
+        return "transient"
+    return None
+
+def _on_retryable(sched, err, kind: str, attempt: int, retries: int, ch_num) -> float:
+    """Log a retryable failure; a 429 pauses every worker, other errors only back off this one."""
+    wait = _retry_after(err, attempt)
+    if kind == "rate":
+        print(f"[quota] CH{ch_num:02d} got 429 — pausing all workers {wait:.1f}s (retry {attempt + 1}/{retries})")
+        sched.penalize(wait)
+        return 0.0
+    print(f"[quota] CH{ch_num:02d} {type(err).__name__} — retrying in {wait:.1f}s (retry {attempt + 1}/{retries})")
+    return wait
+
+def _quota_cost(cfg: dict, prompt_text: str) -> int:
+    from quota_scheduler import estimate_tokens
+    return estimate_tokens(prompt_text, int(cfg.get("quota_completion_tokens", 1200)) * candidate_count(cfg))
+
+def _log_quota_wait(ch_num, waited: float) -> None:
+    if waited >= 1.0:
+        print(f"[quota] CH{ch_num:02d} waited {waited:.1f}s for API quota")
+
+def quota_completion(client, cfg: dict, prompt_text: str, ch_num: int = 0):
+    """chat_completion behind the shared quota; returns (resp, seconds spent in the API call)."""
+    sched = quota_scheduler(cfg)
+    if sched is None:
+        t0 = time.monotonic()
+        resp = chat_completion(client, cfg, prompt_text)
+        return resp, time.monotonic() - t0
+
+    cost = _quota_cost(cfg, prompt_text)
+    retries = int(cfg.get("quota_max_retries", 5))
+    for attempt in range(retries + 1):
+        _log_quota_wait(ch_num, sched.acquire(cost))
+        t0 = time.monotonic()
+        try:
+            resp = chat_completion(client, cfg, prompt_text)
+        except Exception as e:
+            kind = _retry_kind(e)
+            if kind is None or attempt == retries:
+                raise
+            time.sleep(_on_retryable(sched, e, kind, attempt, retries, ch_num))
+            continue
+        sched.settle(cost, _usage_field(getattr(resp, "usage", None), "total_tokens"))
+        return resp, time.monotonic() - t0
+
+async def quota_completion_async(client, cfg: dict, prompt_text: str, ch_num: int = 0, sent=None):
+    """Async quota_completion; sets the optional asyncio.Event once the request is on the wire."""
+    import asyncio
+    sched = quota_scheduler(cfg)
+    cost = _quota_cost(cfg, prompt_text) if sched else 0
+    retries = int(cfg.get("quota_max_retries", 5)) if sched else 0
+    for attempt in range(retries + 1):
+        if sched:
+            # cancellable: a hedge loser cancelled while queued gives up its ticket and spends nothing
+            _log_quota_wait(ch_num, await sched.acquire_async(cost))
+        if sent is not None:
+            sent.set()
+        t0 = time.monotonic()
+        try:
+            resp = await chat_completion_async(client, cfg, prompt_text)
+        except Exception as e:
+            kind = _retry_kind(e) if sched else None
+            if kind is None or attempt == retries:
+                raise
+            await asyncio.sleep(_on_retryable(sched, e, kind, attempt, retries, ch_num))
+            continue
+        if sched:
+            sched.settle(cost, _usage_field(getattr(resp, "usage", None), "total_tokens"))
+        return resp, time.monotonic() - t0
+
+# ------------------------------------------------
+# Hedged requests (tail-latency cut per chapter)
+# ------------------------------------------------
+# Chapter latencies go into a bucketed histogram under <output_dir>/stats. With
+# hedge_requests on, a chapter that is still pending after the configured
+# percentile of that histogram gets a duplicate request; the first response
+# wins and the other task is cancelled, which aborts its in-flight HTTP call.
+
+LATENCY_BUCKETS = [0.5, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233]  # upper bounds, seconds
+
+def stats_dir(cfg: dict) -> Path:
+    return HERE / cfg.get("output_dir", "output") / "stats"
+
+_stats_lock = threading.Lock()
+
+@contextmanager
+def locked_json(path: Path):
+    """Read-modify-write a shared stats file: yields its dict under an flock, then writes it back."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _stats_lock, open(path.with_name(path.name + ".lock"), "a+") as lf:
+        if fcntl is not None:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+        try:
+            data = {}
+            if path.exists():
+                try:
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    data = {}
+            yield data
+            atomic_write_text(path, json.dumps(data, indent=2))
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+class LatencyHistogram:
+    """Bucketed chapter-latency histogram persisted as JSON; record() is the only (locked) writer."""
+
+    def __init__(self, path: Path, counts=None, overflow=0):
+        self.path = path
+        self.counts = list(counts) if counts else [0] * len(LATENCY_BUCKETS)
+        self.overflow = overflow
+
+    @classmethod
+    def load(cls, cfg: dict) -> "LatencyHistogram":
+        path = stats_dir(cfg) / "chapter_latency.json"
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("buckets") == LATENCY_BUCKETS:
+                    return cls(path, data["counts"], data.get("overflow", 0))
+            except (OSError, ValueError, KeyError):
+                pass
+        return cls(path)
+
+    @classmethod
+    def record(cls, cfg: dict, seconds: float) -> None:
+        """Add one sample to the shared histogram; safe with many processes writing at once."""
+        path = stats_dir(cfg) / "chapter_latency.json"
+        with locked_json(path) as data:
+            hist = cls(path, data.get("counts"), data.get("overflow", 0)) \
+                if data.get("buckets") == LATENCY_BUCKETS else cls(path)
+            hist.observe(seconds)
+            data.update(buckets=LATENCY_BUCKETS, counts=hist.counts, overflow=hist.overflow)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts) + self.overflow
+
+    def observe(self, seconds: float) -> "LatencyHistogram":
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                return self
+        self.overflow += 1
+        return self
+
+    def percentile(self, pct: float) -> float | None:
+        """Upper bound of the bucket holding the pct-th percentile (None when empty)."""
+        if not self.total:
+            return None
+        rank = pct / 100.0 * self.total
+        seen = 0
+        for bound, n in zip(LATENCY_BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return float(bound)
+        return float(LATENCY_BUCKETS[-1])
+
+def hedge_delay(cfg: dict, hist: LatencyHistogram) -> float:
+    """Seconds to wait before hedging: histogram percentile once warmed up, else the static fallback."""
+    if hist.total >= int(cfg.get("hedge_min_samples", 20)):
+        p = hist.percentile(float(cfg.get("hedge_percentile", 95)))
+        if p is not None:
+            return p
+    return float(cfg.get("hedge_after_seconds", 45))
+
+def record_hedge(cfg: dict, **deltas) -> dict:
+    with locked_json(stats_dir(cfg) / "hedge_stats.json") as stats:
+        for k in ("requests", "hedged", "hedge_wins", "extra_prompt_tokens", "extra_completion_tokens"):
+            stats.setdefault(k, 0)
+        for k, v in deltas.items():
+            stats[k] = stats.get(k, 0) + v
+        return dict(stats)
+
+async def _race_with_hedge(cfg: dict, prompt_text: str, api_key: str, delay: float, ch_num: int):
+    import asyncio
+    client = make_client(cfg, api_key, async_client=True)
+    async with client:
+        async def attempt(sent=None):
+            return await quota_completion_async(client, cfg, prompt_text, ch_num, sent)
+
+        # the hedge clock starts once the primary is actually sent, not while it queues for quota
+        sent = asyncio.Event()
+        primary = asyncio.create_task(attempt(sent))
+        tasks = [primary]
+        sent_wait = asyncio.create_task(sent.wait())
+        await asyncio.wait([primary, sent_wait], return_when=asyncio.FIRST_COMPLETED)
+        sent_wait.cancel()
+        dup_sent = asyncio.Event()
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            print(f"[hedge] CH{ch_num:02d} pending after {delay:.1f}s — sending duplicate request")
+            tasks.append(asyncio.create_task(attempt(dup_sent)))
+
+        pending, winner, last_err = set(tasks), None, None
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if t.exception() is not None:
+                    last_err = t.exception()
+                elif winner is None:
+                    winner = t
+        # cancelling the task closes the loser's HTTP stream
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    if winner is None:
+        raise last_err
+    resp, elapsed = winner.result()
+    # a duplicate cancelled while still queued for quota never reached the API
+    return resp, elapsed, len(tasks) > 1, winner is not primary, dup_sent.is_set()
+
+def hedged_completion(cfg: dict, prompt_text: str, api_key: str, ch_num: int):
+    """Send the chapter request, duplicating it once if it outlives the hedge delay."""
+    import asyncio
+    hist = LatencyHistogram.load(cfg)
+    resp, elapsed, hedged, duplicate_won, duplicate_sent = asyncio.run(
+        _race_with_hedge(cfg, prompt_text, api_key, hedge_delay(cfg, hist), ch_num))
+
+    LatencyHistogram.record(cfg, elapsed)
+    usage = getattr(resp, "usage", None)
+    record_hedge(
+        cfg,
+        requests=1,
+        hedged=int(hedged),
+        hedge_wins=int(duplicate_won),
+        # the losing request was billed for at least its prompt; completion tokens are an upper-bound estimate
+        extra_prompt_tokens=_usage_field(usage, "prompt_tokens") if duplicate_sent else 0,
+        extra_completion_tokens=_usage_field(usage, "completion_tokens") if duplicate_sent else 0,
+    )
+    return resp
+
+def print_hedge_report(cfg: dict) -> None:
+    hist = LatencyHistogram.load(cfg)
+    path = stats_dir(cfg) / "hedge_stats.json"
+    stats = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    n = stats.get("requests", 0)
+    rate = 100.0 * stats.get("hedged", 0) / n if n else 0.0
+    pcts = " ".join(f"p{p}={hist.percentile(p)}s" for p in (50, 95, 99)) if hist.total else "no samples"
+    print(f"[hedge] latency {pcts} | hedged {stats.get('hedged', 0)}/{n} ({rate:.1f}%), "
+          f"duplicate won {stats.get('hedge_wins', 0)} | extra tokens ~{stats.get('extra_prompt_tokens', 0)} prompt "
+          f"+ {stats.get('extra_completion_tokens', 0)} completion")
+
+# ------------------------------------------------
+# Multi-candidate generation (local scoring)
+# ------------------------------------------------
+# With candidates > 1 the chapter request asks for n completions in one round
+# trip. Each is cleaned the way stitching cleans it (the [STATE:]/[LEN:] header
+# the templates ask for is dropped first), then scored locally: the locked card
+# must appear in the prose (CH01-05), no meta line may survive cleaning, and the
+# word count should land in the template's [LEN: target lo–hi]. The best is
+# kept; every candidate's score goes to CHxx_score.json.
+
+LEN_TARGET_RE = re.compile(r"^\[LEN: target (\d+)\s*[–-]\s*(\d+)\]", re.MULTILINE)
+# Leftover meta: a line opening a [STATE:/[LEN: block (closed or not), a whole bracketed
+# tag line, or the stray "...]" tail of a wrapped block whose opening line was dropped
+META_LINE_RE = re.compile(
+    r"^[ \t]*\[(?:(?:STATE|LEN):|[A-Z][A-Z _-]*(?::[^\]\n]*)?\][ \t]*$)|^[^\[\n]*\][ \t]*$",
+    re.MULTILINE,
+)
+
+def candidate_count(cfg: dict) -> int:
+    return max(1, int(cfg.get("candidates", 1)))
+
+def length_target(prompt_text: str) -> tuple[int, int] | None:
+    m = LEN_TARGET_RE.search(prompt_text)
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+def clean_chapter_text(text: str) -> str:
+    text = _strip_meta_headers(text)
+    text = sanitize_trailing_closer(text)
+    text = rotate_oh_wow(text)
+    return scrub_bracketed_meta(text)
+
+def _prose_lines(text: str) -> list[str]:
+    """Lines outside bracketed blocks; a block opened by "[" at line start runs to its closing "]"."""
+    prose, in_block = [], False
+    for line in text.splitlines():
+        if not in_block and line.lstrip().startswith("["):
+            in_block = True
+        if in_block:
+            in_block = "]" not in line
+            continue
+        prose.append(line)
+    return prose
+
+def score_candidate(cleaned: str, ch_num: int, target: tuple[int, int] | None,
+                    finish_reason: str | None = None) -> dict:
+    """Score one cleaned completion out of 100; "ok" means every hard check passed."""
+    score = 100.0
+    prose = "\n".join(_prose_lines(cleaned))
+    card_ok = True
+    if 1 <= ch_num <= 5 and SPREAD_LOCK is not None:
+        card = base_title(chapter_card_for(ch_num)["title"])
+        card_ok = card.lower() in prose.lower()
+        if not card_ok:
+            score -= 50
+    meta_lines = len(META_LINE_RE.findall(cleaned))
+    if meta_lines:
+        score -= 30
+    words = len(prose.split())
+    length_ok = True
+    if target:
+        lo, hi = target
+        miss = lo - words if words < lo else words - hi if words > hi else 0
+        length_ok = miss == 0
+        score -= min(20.0, 20.0 * miss / max(1, hi - lo))
+    if finish_reason == "length":  # cut off by max_tokens
+        score -= 25
+    return {
+        "score": round(score, 1), "ok": card_ok and not meta_lines and length_ok,
+        "card_ok": card_ok, "meta_lines": meta_lines, "words": words,
+        "length_ok": length_ok, "finish_reason": finish_reason,
+    }
+
+def select_candidate(resp, ch_num: int, prompt_text: str, out_dir: Path) -> str:
+    """Clean and score every choice in resp; save the scores and return the best cleaned text."""
+    target = length_target(prompt_text)
+    scored = []
+    for choice in resp.choices:
+        cleaned = clean_chapter_text(choice.message.content or "")
+        scored.append((score_candidate(cleaned, ch_num, target, getattr(choice, "finish_reason", None)), cleaned))
+    # hard checks first, then score; ties keep the earliest choice
+    best = max(range(len(scored)), key=lambda i: (scored[i][0]["ok"], scored[i][0]["score"], -i))
+    atomic_write_text(out_dir / f"CH{ch_num:02d}_score.json", json.dumps({
+        "chosen": best, "target_words": list(target) if target else None,
+        "candidates": [sc for sc, _ in scored],
+    }, indent=2))
+    chosen = scored[best][0]
+    if len(scored) > 1:
+        print(f"[select] CH{ch_num:02d} kept candidate {best + 1}/{len(scored)} "
+              f"(score {chosen['score']}, {chosen['words']} words)")
+    if not chosen["ok"]:
+        print(f"[warn] CH{ch_num:02d} best candidate failed checks: "
+              f"card_ok={chosen['card_ok']} meta_lines={chosen['meta_lines']} words={chosen['words']}")
+    return scored[best][1]
+
 # --- concurrent generation helper (NEW) ---
 def generate_one(ch_num, out_dir: Path, cfg: dict, prompt_text: str):
   try:
@@ -337,23 +849,15 @@ def generate_one(ch_num, out_dir: Path, cfg: dict, prompt_text: str):
     if not api_key:
       print("OPENAI_API_KEY not set — skipping generation.")
       return None
-    client = openai.OpenAI(api_key=api_key)
-    model = cfg.get("openai_model", "gpt-4o")  # fallback aligned with your config
-    temperature = float(cfg.get("temperature", 0.6))
-
-    resp = client.chat.completions.create(
-      model=model,
-      temperature=temperature,
-      messages=[
-        {"role": "system",
-         "content": "You are ANGELA for White Soul Tarot 2. Follow the script and tone rules exactly as provided in the prompt text."},
-        {"role": "user", "content": prompt_text}
-      ]
-    )
-    text = resp.choices[0].message.content or ""
-    text = sanitize_trailing_closer(text)
-    text = rotate_oh_wow(text)
-    text = scrub_bracketed_meta(text)
+
+    if cfg.get("hedge_requests"):
+      resp = hedged_completion(cfg, prompt_text, api_key, ch_num)
+    else:
+      client = make_client(cfg, api_key)
+      resp, elapsed = quota_completion(client, cfg, prompt_text, ch_num)
+      LatencyHistogram.record(cfg, elapsed)
+    record_usage(out_dir, ch_num, resp)
+    text = select_candidate(resp, ch_num, prompt_text, out_dir)
 
     outp = out_dir / f"CH{ch_num:02d}_generated.txt"
     outp.write_text(text, encoding="utf-8")
@@ -415,12 +919,16 @@ def resolve_chapter_list(cfg):
 # Auto-stitching support
 # -----------------------
 
+META_HEADER_MAX_LINES = 4
+
 def _strip_meta_headers(text: str) -> str:
     lines = text.splitlines()
     while lines and not lines[0].strip():
         lines.pop(0)
     while lines and (lines[0].startswith("[STATE:") or lines[0].startswith("[LEN:")):
-        lines.pop(0)
+        # a header may wrap; drop through the line that closes it (only the first line if never closed)
+        close = next((i for i, ln in enumerate(lines[:META_HEADER_MAX_LINES]) if "]" in ln), 0)
+        del lines[:close + 1]
     if lines and not lines[0].strip():
         lines.pop(0)
     return "\n".join(lines).strip()
@@ -458,69 +966,277 @@ def stitch_reading(out_dir: Path, chapters: list[int], breaks_mode: str = "none"
 def is_full_run(chapters: list[int]) -> bool:
     return sorted(chapters) == [1,2,3,4,5,6,7]
 
-def main():
-    print("[debug] entered main()", flush=True)
+def run_complete(run_dir: Path, chapters: list[int]) -> bool:
+    """Full run whose every chapter was generated and stitched (not a prompt-text fallback)."""
+    return (is_full_run(chapters)
+            and all((run_dir / f"CH{ch:02d}_generated.txt").exists() for ch in chapters)
+            and (run_dir / "FULL_READING.txt").exists())
 
-    cfg = load_config()
+# -----------------------------------------
+# Run isolation + atomic publish (per sign)
+# -----------------------------------------
+# Each run works in output/runs/<sign>__<stamp>__XXXX/ so concurrent runs never
+# share CHxx_* or FULL_READING.txt. Finished artifacts are copied next to their
+# destination and os.replace()d into place, so readers see either the old file
+# or the new one, never a partial write.
+
+RUNS_SUBDIR = "runs"
+LATEST_SUBDIR = "latest"
+PUBLISHED_MARKER = ".published"
+
+def run_stamp() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
+
+def make_run_dir(base_out: Path, sign: str, stamp: str) -> Path:
+    runs = base_out / RUNS_SUBDIR
+    runs.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=f"{sign}__{stamp}__", dir=runs))
+
+def atomic_write_text(dst: Path, text: str) -> Path:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".tmp", dir=dst.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return dst
+
+def atomic_publish(src: Path, dst: Path) -> Path:
+    return atomic_write_text(dst, src.read_text(encoding="utf-8"))
+
+def _rel_to(p: Path, base: Path) -> str:
+    try:
+        return str(p.relative_to(base))
+    except ValueError:
+        return str(p)  # WST_RUN_DIR may live outside output/
+
+def latest_pointer_path(base_out: Path, sign: str) -> Path:
+    return base_out / LATEST_SUBDIR / f"{sign}.json"
+
+def run_suffix(run_dir: Path) -> str:
+    """Unique tail of a run dir name (mkdtemp's 8 random chars), so same-second runs publish distinct files."""
+    if "__" in run_dir.name:  # make_run_dir / reading_pool: <prefix>__XXXXXXXX
+        return run_dir.name[-8:]
+    import hashlib  # e.g. a WST_RUN_DIR chosen by the caller
+    return hashlib.sha1(str(run_dir.resolve()).encode("utf-8")).hexdigest()[:8]
+
+def publish_run(run_dir: Path, base_out: Path, sign: str, stamp: str) -> dict:
+    """Publish finished run artifacts into base_out and swing the sign's latest pointer."""
+    published = {}
+    stamp_id = f"{stamp}__{run_suffix(run_dir)}"
+    for name, prefix, ext in (("FULL_READING.txt", "FULL_READING", ".txt"),
+                              ("FULL_READING_with_breaks.txt", "FULL_READING_with_breaks", ".txt")):
+        src = run_dir / name
+        if not src.exists():
+            continue
+        dst = atomic_publish(src, base_out / f"{prefix}__{sign}__{stamp_id}{ext}")
+        # Legacy fixed names for tools that still read output/FULL_READING*.txt (last writer wins)
+        atomic_publish(src, base_out / name)
+        published[name] = str(dst.relative_to(base_out))
+        print(f"[ok] Published {dst.name}")
+    # The TTS chunk manifest stays in the run dir (pinned by the pointer, see prune_runs): a copy in
+    # base_out would share the FULL_READING_with_breaks__<sign>__ prefix the web download picks by mtime
+    from apply_breaks import chunk_manifest_path
+    manifest = Path(chunk_manifest_path(run_dir / "FULL_READING_with_breaks.txt"))
+    if manifest.exists():
+        published[manifest.name] = _rel_to(manifest, base_out)
+
+    pointer = {
+        "sign": sign,
+        "stamp": stamp,
+        "run_dir": _rel_to(run_dir, base_out),
+        "artifacts": published,
+    }
+    atomic_write_text(latest_pointer_path(base_out, sign), json.dumps(pointer, indent=2))
+    (run_dir / PUBLISHED_MARKER).touch()
+    return pointer
+
+def prune_runs(base_out: Path, keep: int) -> None:
+    """Drop the oldest published run dirs beyond keep; unpublished (in-flight) runs are never touched."""
+    runs = base_out / RUNS_SUBDIR
+    if keep < 0 or not runs.exists():
+        return
+    pinned = set()
+    latest = base_out / LATEST_SUBDIR
+    if latest.exists():
+        for p in latest.glob("*.json"):
+            try:
+                pinned.add(json.loads(p.read_text(encoding="utf-8")).get("run_dir"))
+            except (OSError, ValueError):
+                continue
+    done = sorted((d for d in runs.iterdir() if (d / PUBLISHED_MARKER).exists()),
+                  key=lambda d: d.stat().st_mtime, reverse=True)
+    for d in done[keep:]:
+        if str(d.relative_to(base_out)) not in pinned:
+            shutil.rmtree(d, ignore_errors=True)
+
+# -----------------------------------------
+# Library API (the CLI below is a thin wrapper)
+# -----------------------------------------
+# One reading at a time per process: the spread lock is module state, so run
+# concurrent readings as separate processes (see scripts/load_test.py).
+
+def reset_spread() -> None:
+    """Forget the locked spread so the next choose_spread() draws a new one."""
+    global SPREAD_LOCK
+    SPREAD_LOCK = None
+
+def render_prompts(cfg: dict, out_dir: Path, chapters: list[int] | None = None) -> dict[int, Path]:
+    """Write CHxx_prompt.txt for each chapter (drawing the spread if needed); returns {chapter: path}."""
+    spread = choose_spread(cfg)
+    prompts_by_ch = {}
+    for ch in chapters or resolve_chapter_list(cfg):
+        p = write_prompt(ch, spread, cfg, out_dir)
+        prompts_by_ch[ch] = p
+        print(f"[ok] Wrote {p.name}")
+    return prompts_by_ch
+
+def generate_chapters(cfg: dict, out_dir: Path, prompts_by_ch: dict[int, Path],
+                      timings: dict | None = None) -> dict[int, Path | None]:
+    """Generate chapters sequentially; a failed chapter maps to None instead of aborting the rest."""
+    print(f"[info] Starting sequential generation for chapters: {list(prompts_by_ch)}")
+    results = {}
+    for ch, prompt_path in prompts_by_ch.items():
+        t_ch = time.monotonic()
+        try:
+            print(f"[info] Generating CH{ch:02d}...")
+            results[ch] = generate_one(ch, out_dir, cfg, prompt_path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"[warn] CH{ch:02d} generation error: {e}")
+            # Continue to next chapter instead of failing
+            results[ch] = None
+        if timings is not None:
+            timings["chapters"][f"CH{ch:02d}"] = time.monotonic() - t_ch
+    summarize_usage(out_dir)
+    if cfg.get("hedge_requests"):
+        print_hedge_report(cfg)
+    return results
+
+def write_with_breaks(cfg: dict, stitched_path: Path) -> Path:
+    """Write FULL_READING_with_breaks.txt next to the stitched reading (plus the TTS chunk manifest if enabled)."""
+    full_text = stitched_path.read_text(encoding="utf-8")
+    full_text = apply_break_ruleset(full_text, micro_sprinkles=True)
+    out_with_breaks = stitched_path.with_name("FULL_READING_with_breaks.txt")
+    out_with_breaks.write_text(full_text, encoding="utf-8")
+    print(f"[ok] Wrote {out_with_breaks.name} with speech breaks")
+    if cfg.get("tts_chunks"):
+        from apply_breaks import chunk_manifest_path, write_chunk_manifest
+        write_chunk_manifest(full_text, chunk_manifest_path(out_with_breaks), out_with_breaks.name,
+                             int(cfg.get("tts_chunk_max_chars", 2500)),
+                             float(cfg.get("tts_chunk_max_seconds", 180)))
+    return out_with_breaks
+
+def run_pipeline(cfg: dict | None = None, *, sign: str | None = None, mode: str | None = None,
+                 breaks_mode: str | None = None, chapter: int | None = None,
+                 run_dir: Path | str | None = None, publish: bool = True) -> dict:
+    """
+    Render prompts, generate, stitch, apply breaks and publish one reading.
+
+    Arguments default to cfg (config.yaml when cfg is None). Returns
+    {"sign", "run_dir", "chapters", "published", "timings"}; "published" is the
+    latest-pointer dict, or None for partial (single-chapter) runs, runs where
+    any chapter failed to generate (prompts-only runs included) and when
+    publish=False (e.g. pre-generated pool readings, see reading_pool.py).
+    """
+    cfg = dict(cfg if cfg is not None else load_config())
     if cfg.get("seed") is not None:
         random.seed(cfg["seed"])
+    reset_spread()
 
-    out_dir = (HERE / cfg.get("output_dir", "output"))
-    out_dir.mkdir(parents=True, exist_ok=True)
+    sign = sign or cfg.get("sign", "Gemini")
+    cfg["sign"] = sign
+    base_out = (HERE / cfg.get("output_dir", "output"))
+    base_out.mkdir(parents=True, exist_ok=True)
+
+    # Work in a private run dir; run_dir reuses an existing one (e.g. single-chapter reruns)
+    stamp = run_stamp()
+    if run_dir:
+        out_dir = Path(run_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        out_dir = make_run_dir(base_out, sign, stamp)
+    print(f"[info] Run dir: {out_dir}")
 
     spread = choose_spread(cfg)
     print(f"[info] Locked spread: {spread}")
 
-    # Check for single chapter mode from environment
-    single_chapter = os.environ.get("WST_CHAPTER")
-    if single_chapter:
-        try:
-            ch_num = int(single_chapter)
-            if 1 <= ch_num <= 7:
-                chapters = [ch_num]
-                print(f"[info] Single chapter mode: CH{ch_num:02d}")
-            else:
-                chapters = resolve_chapter_list(cfg)
-        except ValueError:
-            chapters = resolve_chapter_list(cfg)
+    if chapter is not None and 1 <= chapter <= 7:
+        chapters = [chapter]
+        print(f"[info] Single chapter mode: CH{chapter:02d}")
     else:
+        chapter = None
         chapters = resolve_chapter_list(cfg)
 
+    # Per-stage wall times, written to the run dir for load tests and tuning
+    timings = {"chapters": {}}
+    t_stage = time.monotonic()
+
     # 1) Always write prompts first (fast)
-    prompts_by_ch = {}
-    for ch in chapters:
-        p = write_prompt(ch, spread, cfg, out_dir)
-        prompts_by_ch[ch] = p
-        print(f"[ok] Wrote {p.name}")
+    prompts_by_ch = render_prompts(cfg, out_dir, chapters)
+    timings["prompts"] = time.monotonic() - t_stage
 
     # 2) Generate sequentially if enabled (removed concurrency)
-    mode = os.environ.get("WST_MODE") or cfg.get("mode", "prompts")
+    mode = mode or cfg.get("mode", "prompts")
     if mode == "generate":
-        print(f"[info] Starting sequential generation for chapters: {chapters}")
-        
-        for ch in chapters:
-            try:
-                print(f"[info] Generating CH{ch:02d}...")
-                generate_one(ch, out_dir, cfg, prompts_by_ch[ch].read_text(encoding="utf-8"))
-            except Exception as e:
-                print(f"[warn] CH{ch:02d} generation error: {e}")
-                # Continue to next chapter instead of failing
+        t_stage = time.monotonic()
+        generate_chapters(cfg, out_dir, prompts_by_ch, timings)
+        timings["generate"] = time.monotonic() - t_stage
     else:
         print("[info] mode != generate — prompts only (no API calls)")
 
     # 3) Auto-stitch when running the full set (only if not single chapter mode)
-    if not single_chapter and is_full_run(chapters):
-        breaks_mode = (os.environ.get("WST_BREAKS_MODE") or str(cfg.get("breaks_output", "none"))).lower()
+    published = None
+    if chapter is None and is_full_run(chapters):
+        breaks_mode = (breaks_mode or str(cfg.get("breaks_output", "none"))).lower()
+        t_stage = time.monotonic()
         stitched_path = stitch_reading(out_dir, chapters, breaks_mode)
+        timings["stitch"] = time.monotonic() - t_stage
 
         # Optional: write a with-breaks version based on env or config
         if breaks_mode in ("with_breaks", "both"):
-            full_text = stitched_path.read_text(encoding="utf-8")
-            full_text = apply_break_ruleset(full_text, micro_sprinkles=True)
-            out_with_breaks = stitched_path.with_name("FULL_READING_with_breaks.txt")
-            out_with_breaks.write_text(full_text, encoding="utf-8")
-            print(f"[ok] Wrote {out_with_breaks.name} with speech breaks")
+            t_stage = time.monotonic()
+            write_with_breaks(cfg, stitched_path)
+            timings["breaks"] = time.monotonic() - t_stage
+
+        if publish and mode != "generate":
+            print(f"[info] Prompts-only run: stitched prompts stay in {out_dir.name}; nothing published")
+        elif publish and not run_complete(out_dir, chapters):
+            # stitch fell back to prompt text; never let that replace the sign's last good reading
+            missing = [ch for ch in chapters if not (out_dir / f"CH{ch:02d}_generated.txt").exists()]
+            print(f"[warn] Not publishing {sign}: no generated text for "
+                  f"{', '.join(f'CH{ch:02d}' for ch in missing)}; latest pointer unchanged")
+        elif publish:
+            t_stage = time.monotonic()
+            published = publish_run(out_dir, base_out, sign, stamp)
+            prune_runs(base_out, int(cfg.get("keep_runs", 20)))
+            timings["publish"] = time.monotonic() - t_stage
+
+    atomic_write_text(out_dir / RUN_TIMINGS, json.dumps(timings, indent=2))
+    return {"sign": sign, "run_dir": out_dir, "chapters": chapters, "published": published, "timings": timings}
+
+def main():
+    cfg = load_config()
+    if os.environ.get("WST_OUTPUT_DIR"):
+        cfg["output_dir"] = os.environ["WST_OUTPUT_DIR"]
+    # Check for single chapter mode from environment
+    try:
+        chapter = int(os.environ["WST_CHAPTER"]) if os.environ.get("WST_CHAPTER") else None
+    except ValueError:
+        chapter = None
+    run_pipeline(
+        cfg,
+        sign=os.environ.get("WST_SIGN"),
+        mode=os.environ.get("WST_MODE"),
+        breaks_mode=os.environ.get("WST_BREAKS_MODE"),
+        chapter=chapter,
+        run_dir=os.environ.get("WST_RUN_DIR"),
+    )
 
-print("[debug] about to call main()", flush=True)
 if __name__ == "__main__":
     main()
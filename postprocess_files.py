@@ -5,19 +5,38 @@ Downstream post-processing helpers for stitched tarot readings.
 Responsibilities:
 - Prepend a two-line header to FULL_READING.txt with zodiac sign and ISO timestamp
 - Optionally write timestamped copies for history
+- Pack old timestamped readings into compressed archive segments (and restore them)
 
 Usage:
   python3 postprocess_files.py header <SIGN>
   python3 postprocess_files.py copy_stitched <SIGN>
+  python3 postprocess_files.py archive [DAYS]
+  python3 postprocess_files.py unpack <SEGMENT> [NAME ...]
+  python3 postprocess_files.py read <NAME>
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import gzip
+import json
+import os
+import re
 import sys
+import tempfile
 
 OUTPUT_DIR = Path("output")
+ARCHIVE_DIR = OUTPUT_DIR / "archive"
+ARCHIVE_MAX_AGE_DAYS = 30
+
+# Timestamped history files written by name_stitched_with_sign(), apply_breaks.py --sign
+# and publish_run() (which adds a __<run suffix> after the stamp).
+# __LOCK__ readings are QA references and always stay in the hot directory.
+ARCHIVABLE_RE = re.compile(
+    r"^FULL_READING(?:_with_breaks)?__.+__(?P<stamp>\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2})(?:Z|[+-]\d{2}-\d{2})?"
+    r"(?:__[A-Za-z0-9_]{1,16})?\.txt$"
+)
 
 
 def iso_now() -> str:
@@ -34,16 +53,207 @@ def write_header_into_stitched(sign: str, stitched_filename: str = "FULL_READING
     return OUTPUT_DIR / stitched_filename
 
 
+def _latest_pointers(output_dir: Path = OUTPUT_DIR) -> list[dict]:
+    latest = output_dir / "latest"
+    pointers = []
+    if latest.exists():
+        for p in latest.glob("*.json"):
+            try:
+                pointers.append(json.loads(p.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+    return pointers
+
+
 def name_stitched_with_sign(sign: str) -> Path:
     """Write a timestamped copy of stitched file for history and easy downloads."""
     stamp = iso_now().replace(":", "-")
     src = OUTPUT_DIR / "FULL_READING.txt"
+    pointer = OUTPUT_DIR / "latest" / f"{sign}.json"
+    if pointer.exists():
+        # Prefer this sign's last published run over the shared legacy file; the
+        # published copy may have been archived, so fall back to the run dir
+        data = json.loads(pointer.read_text(encoding="utf-8"))
+        published = data.get("artifacts", {}).get("FULL_READING.txt")
+        candidates = [OUTPUT_DIR / published] if published else []
+        if data.get("run_dir"):
+            candidates.append(OUTPUT_DIR / data["run_dir"] / "FULL_READING.txt")
+        src = next((c for c in candidates if c.exists()), src)
+    if not src.exists():
+        print(f"[warn] No stitched reading for {sign} ({src} missing); nothing copied")
     dst = OUTPUT_DIR / f"FULL_READING__{sign}__{stamp}.txt"
     if src.exists():
-        dst.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+        tmp.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+        os.replace(tmp, dst)
     return dst
 
 
+# -------------------------
+# Archive segments
+# -------------------------
+# A segment is a concatenation of independent gzip members, one per reading, so
+# the whole file is still a valid .gz stream. The sidecar index maps each name to
+# the byte offset/length of its member, which gives one seek + one small
+# decompress per lookup instead of inflating the whole segment.
+
+def _reading_time(path: Path) -> datetime:
+    """Timestamp embedded in the filename, falling back to mtime."""
+    m = ARCHIVABLE_RE.match(path.name)
+    if m:
+        try:
+            return datetime.strptime(m.group("stamp"), "%Y-%m-%dT%H-%M-%S").replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+
+
+def _index_path(segment: Path) -> Path:
+    return segment.with_name(segment.name + ".idx.json")
+
+
+def _load_index(segment: Path) -> dict:
+    return json.loads(_index_path(segment).read_text(encoding="utf-8"))
+
+
+def find_archivable(max_age_days: int = ARCHIVE_MAX_AGE_DAYS, now: datetime | None = None,
+                    output_dir: Path = OUTPUT_DIR) -> list[Path]:
+    """List timestamped readings in output_dir older than max_age_days, plus their sidecars.
+
+    Readings a latest pointer refers to stay. Timeline / chunk-manifest sidecars
+    go with their reading so they never outlive it in the hot directory.
+    """
+    from apply_breaks import sidecar_paths
+    if not output_dir.exists():
+        return []
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=max_age_days)
+    pinned = {Path(rel).name for ptr in _latest_pointers(output_dir)
+              for rel in ptr.get("artifacts", {}).values()}
+    readings = [
+        p for p in output_dir.iterdir()
+        if p.is_file() and ARCHIVABLE_RE.match(p.name) and "__LOCK__" not in p.name
+        and p.name not in pinned and _reading_time(p) < cutoff
+    ]
+    sidecars = [Path(s) for p in readings for s in sidecar_paths(p) if Path(s).is_file()]
+    return sorted(readings + sidecars)
+
+
+def pack_segment(paths: list[Path], segment: Path) -> dict:
+    """Write paths into a compressed segment plus offset index; returns the index.
+
+    Never replaces an existing segment: raises FileExistsError if segment is taken.
+    """
+    segment.parent.mkdir(parents=True, exist_ok=True)
+    entries = {}
+    fd, tmp = tempfile.mkstemp(prefix=f".{segment.name}.", suffix=".tmp", dir=segment.parent)
+    tmp_seg = Path(tmp)
+    with os.fdopen(fd, "wb") as out:
+        for p in paths:
+            raw = p.read_bytes()
+            member = gzip.compress(raw, compresslevel=9, mtime=0)
+            entries[p.name] = {
+                "offset": out.tell(),
+                "length": len(member),
+                "size": len(raw),
+                "mtime": p.stat().st_mtime,
+            }
+            out.write(member)
+        out.flush()
+        os.fsync(out.fileno())
+    try:
+        # link, not replace: claiming the name is atomic and fails if another run holds it
+        os.link(tmp_seg, segment)
+    finally:
+        tmp_seg.unlink()
+    index = {"version": 1, "segment": segment.name, "entries": entries}
+    tmp_idx = _index_path(segment).with_name(f".{_index_path(segment).name}.{os.getpid()}.tmp")
+    tmp_idx.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    os.replace(tmp_idx, _index_path(segment))
+    return index
+
+
+def read_from_segment(segment: Path, name: str, index: dict | None = None) -> bytes:
+    """Fetch a single reading from a segment with one seek."""
+    entry = (index or _load_index(segment))["entries"].get(name)
+    if entry is None:
+        raise KeyError(f"{name} not in {segment.name}")
+    with segment.open("rb") as f:
+        f.seek(entry["offset"])
+        return gzip.decompress(f.read(entry["length"]))
+
+
+def archive_old_readings(max_age_days: int = ARCHIVE_MAX_AGE_DAYS, output_dir: Path = OUTPUT_DIR) -> Path | None:
+    """Pack old readings into a new segment under output_dir/archive and remove the originals once verified."""
+    paths = find_archivable(max_age_days, output_dir=output_dir)
+    if not paths:
+        print(f"[info] No readings older than {max_age_days} days to archive")
+        return None
+    stamp = iso_now().replace(":", "-")
+    # Runs within the same second get __01, __02, ... (sorts after the bare name, so newest-first holds)
+    for seq in range(1000):
+        suffix = f"__{seq:02d}" if seq else ""
+        segment = output_dir / ARCHIVE_DIR.name / f"readings__{stamp}{suffix}.seg.gz"
+        try:
+            index = pack_segment(paths, segment)
+            break
+        except FileExistsError:
+            continue
+    else:
+        raise RuntimeError(f"No free archive segment name for {stamp}; originals kept")
+    for p in paths:
+        if read_from_segment(segment, p.name, index) != p.read_bytes():
+            raise RuntimeError(f"Archive verification failed for {p.name}; originals kept")
+    for p in paths:
+        p.unlink()
+    print(f"[ok] Archived {len(paths)} readings → {segment}")
+    return segment
+
+
+def find_archived(name: str, output_dir: Path = OUTPUT_DIR) -> Path | None:
+    """Locate the segment under output_dir/archive holding name, newest segment first."""
+    archive_dir = output_dir / ARCHIVE_DIR.name
+    if not archive_dir.exists():
+        return None
+    for idx in sorted(archive_dir.glob("*.idx.json"), reverse=True):
+        segment = idx.with_name(idx.name[: -len(".idx.json")])
+        if name in _load_index(segment)["entries"]:
+            return segment
+    return None
+
+
+def read_archived(name: str, output_dir: Path = OUTPUT_DIR) -> bytes | None:
+    """Contents of an archived reading under output_dir (None when no segment holds it)."""
+    segment = find_archived(name, output_dir)
+    return read_from_segment(segment, name) if segment else None
+
+
+def unpack_segment(segment: Path, names: list[str] | None = None, dest: Path | None = None,
+                   output_dir: Path = OUTPUT_DIR) -> list[Path]:
+    """Restore readings from a segment into dest (default output_dir); all of them when names is empty.
+
+    A bare segment name is looked up in output_dir/archive. Named readings bring
+    their archived sidecars (timeline, chunk manifest) along.
+    """
+    from apply_breaks import sidecar_paths
+    if not segment.exists() and segment.parent == Path("."):
+        segment = output_dir / ARCHIVE_DIR.name / segment.name
+    index = _load_index(segment)
+    dest = dest or output_dir
+    if names:
+        names = list(names) + [Path(s).name for n in names for s in sidecar_paths(n)
+                               if Path(s).name in index["entries"] and Path(s).name not in names]
+    dest.mkdir(parents=True, exist_ok=True)
+    restored = []
+    for name in names or list(index["entries"]):
+        dst = dest / name
+        dst.write_bytes(read_from_segment(segment, name, index))
+        mtime = index["entries"][name]["mtime"]
+        os.utime(dst, (mtime, mtime))
+        restored.append(dst)
+    print(f"[ok] Restored {len(restored)} readings from {segment.name}")
+    return restored
+
+
 def main() -> int:
     cmd = sys.argv[1] if len(sys.argv) > 1 else ""
     if cmd == "header":
@@ -61,6 +271,30 @@ def main() -> int:
         sign = sys.argv[2]
         name_stitched_with_sign(sign)
         return 0
+    if cmd == "archive":
+        try:
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else ARCHIVE_MAX_AGE_DAYS
+        except ValueError:
+            print("Usage: python3 postprocess_files.py archive [DAYS]")
+            return 2
+        archive_old_readings(days)
+        return 0
+    if cmd == "unpack":
+        if len(sys.argv) < 3:
+            print("Usage: python3 postprocess_files.py unpack <SEGMENT> [NAME ...]")
+            return 2
+        unpack_segment(Path(sys.argv[2]), sys.argv[3:])
+        return 0
+    if cmd == "read":
+        if len(sys.argv) < 3:
+            print("Usage: python3 postprocess_files.py read <NAME>")
+            return 2
+        data = read_archived(sys.argv[2])
+        if data is None:
+            print(f"{sys.argv[2]} not found in {ARCHIVE_DIR}")
+            return 1
+        sys.stdout.write(data.decode("utf-8"))
+        return 0
 
     print("Unknown command")
     return 1
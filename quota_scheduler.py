@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Host-wide request/token quota shared by every generate_prompts.py process.
+
+Two token buckets (requests per minute, tokens per minute) live in a small JSON
+state file (<output_dir>/stats/quota.json) guarded by an flock, so per-sign jobs, cron batches and web-triggered
+runs on one host draw from the same budget. Waiters take a ticket and are served
+strictly in FIFO order; tickets left behind by dead processes are dropped. A 429
+from the API can pause everyone via penalize().
+
+Usage:
+  python3 quota_scheduler.py status
+  python3 quota_scheduler.py reset
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: fall back to a per-process lock
+    fcntl = None
+
+HERE = Path(__file__).parent
+STALE_TICKET_SECONDS = 600
+POLL_SECONDS = 0.25
+
+_local_lock = threading.Lock()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class QuotaScheduler:
+    """FIFO token-bucket scheduler for RPM/TPM limits shared across processes."""
+
+    def __init__(self, rpm: float, tpm: float, state_file: Path | str):
+        self.rpm = float(rpm)
+        self.tpm = float(tpm)
+        self.state_file = Path(state_file)
+        self.lock_file = self.state_file.with_name(self.state_file.name + ".lock")
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "QuotaScheduler | None":
+        """Build from config keys quota_rpm / quota_tpm (None when both are unset or 0)."""
+        rpm = float(cfg.get("quota_rpm") or 0)
+        tpm = float(cfg.get("quota_tpm") or 0)
+        if rpm <= 0 and tpm <= 0:
+            return None
+        state = (os.environ.get("WST_QUOTA_FILE") or cfg.get("quota_state_file")
+                 or HERE / cfg.get("output_dir", "output") / "stats" / "quota.json")
+        return cls(rpm, tpm, state)
+
+    # --- shared state ---
+
+    @contextmanager
+    def _locked_state(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with _local_lock, open(self.lock_file, "a+") as lf:
+            if fcntl is not None:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+            try:
+                state = self._read()
+                yield state
+                tmp = self.state_file.with_name(f".{self.state_file.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(state), encoding="utf-8")
+                os.replace(tmp, self.state_file)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        now = time.time()
+        state = None
+        if self.state_file.exists():
+            try:
+                state = json.loads(self.state_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                state = None
+        if not state:
+            state = {"requests": self.rpm, "tokens": self.tpm, "updated": now,
+                     "blocked_until": 0.0, "next_ticket": 0, "queue": []}
+        # Refill both buckets for the time elapsed since the last writer
+        elapsed = max(0.0, now - state["updated"])
+        if self.rpm > 0:
+            state["requests"] = min(self.rpm, state["requests"] + elapsed * self.rpm / 60.0)
+        if self.tpm > 0:
+            state["tokens"] = min(self.tpm, state["tokens"] + elapsed * self.tpm / 60.0)
+        state["updated"] = now
+        # Drop tickets whose owner died or stopped polling (ts is a heartbeat refreshed by every poll)
+        state["queue"] = [t for t in state["queue"]
+                          if _pid_alive(t["pid"]) and now - t["ts"] < STALE_TICKET_SECONDS]
+        return state
+
+    # --- public API ---
+
+    def _wait_seconds(self, state: dict, tokens: float) -> float:
+        waits = [state["blocked_until"] - state["updated"]]
+        if self.rpm > 0 and state["requests"] < 1:
+            waits.append((1 - state["requests"]) * 60.0 / self.rpm)
+        if self.tpm > 0 and state["tokens"] < tokens:
+            waits.append((tokens - state["tokens"]) * 60.0 / self.tpm)
+        return max(0.0, *waits)
+
+    def _enqueue(self) -> int:
+        with self._locked_state() as state:
+            ticket = state["next_ticket"]
+            state["next_ticket"] += 1
+            state["queue"].append({"id": ticket, "pid": os.getpid(), "ts": time.time()})
+        return ticket
+
+    def _poll(self, ticket: int, tokens: float) -> float | None:
+        """Take the budget if ticket is at the head and it has refilled (None); else seconds to sleep."""
+        with self._locked_state() as state:
+            mine = next((t for t in state["queue"] if t["id"] == ticket), None)
+            if mine is None:  # pruned while we were away; rejoin at our original place (ids are FIFO order)
+                mine = {"id": ticket, "pid": os.getpid()}
+                state["queue"].append(mine)
+                state["queue"].sort(key=lambda t: t["id"])
+            mine["ts"] = time.time()
+            ids = [t["id"] for t in state["queue"]]
+            wait = self._wait_seconds(state, tokens)
+            if ids[0] == ticket and wait <= 0:
+                if self.rpm > 0:
+                    state["requests"] -= 1
+                if self.tpm > 0:
+                    state["tokens"] -= tokens
+                state["queue"] = [t for t in state["queue"] if t["id"] != ticket]
+                return None
+        # Head of line sleeps until its budget refills; others poll for their turn
+        return min(max(wait, POLL_SECONDS) if ids[0] == ticket else POLL_SECONDS, 5.0) + random.uniform(0, 0.05)
+
+    def _leave(self, ticket: int) -> None:
+        with self._locked_state() as state:
+            state["queue"] = [t for t in state["queue"] if t["id"] != ticket]
+
+    def acquire(self, tokens: float, timeout: float | None = None) -> float:
+        """Block until this process may send one request of ~tokens; returns seconds waited."""
+        tokens = min(float(tokens), self.tpm) if self.tpm > 0 else 0.0
+        start = time.monotonic()
+        ticket = self._enqueue()
+        try:
+            while (sleep := self._poll(ticket, tokens)) is not None:
+                if timeout is not None and time.monotonic() - start > timeout:
+                    raise TimeoutError(f"quota wait exceeded {timeout:.0f}s")
+                time.sleep(sleep)
+        except BaseException:
+            self._leave(ticket)
+            raise
+        return time.monotonic() - start
+
+    async def acquire_async(self, tokens: float, timeout: float | None = None) -> float:
+        """acquire() for asyncio: cancelling the awaiting task gives up the ticket without spending budget."""
+        import asyncio
+        tokens = min(float(tokens), self.tpm) if self.tpm > 0 else 0.0
+        start = time.monotonic()
+        ticket = self._enqueue()
+        try:
+            # polls run inline (the flock is held only briefly) so cancellation can only land in
+            # asyncio.sleep, never between taking the budget and returning
+            while (sleep := self._poll(ticket, tokens)) is not None:
+                if timeout is not None and time.monotonic() - start > timeout:
+                    raise TimeoutError(f"quota wait exceeded {timeout:.0f}s")
+                await asyncio.sleep(sleep)
+        except BaseException:
+            self._leave(ticket)
+            raise
+        return time.monotonic() - start
+
+    def settle(self, estimated: float, actual: float) -> None:
+        """Return (or charge) the difference between estimated and actual tokens."""
+        if self.tpm <= 0 or not actual:
+            return
+        with self._locked_state() as state:
+            state["tokens"] = min(self.tpm, state["tokens"] + min(float(estimated), self.tpm) - float(actual))
+
+    def penalize(self, seconds: float) -> None:
+        """Pause every process on the host, e.g. after a 429 with Retry-After."""
+        with self._locked_state() as state:
+            state["blocked_until"] = max(state["blocked_until"], time.time() + seconds)
+
+    def status(self) -> dict:
+        with self._locked_state() as state:
+            return {
+                "requests_available": round(state["requests"], 2),
+                "tokens_available": round(state["tokens"]),
+                "queued": len(state["queue"]),
+                "blocked_for": round(max(0.0, state["blocked_until"] - state["updated"]), 1),
+            }
+
+
+def estimate_tokens(prompt_text: str, completion_tokens: int = 1200) -> int:
+    """Rough request cost: ~4 chars per prompt token plus an expected completion size."""
+    return len(prompt_text) // 4 + completion_tokens
+
+
+def main() -> int:
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "status"
+    try:
+        import yaml
+        with open(HERE / "config.yaml", encoding="utf-8") as f:
+            cfg = yaml.safe_load(f) or {}
+    except (ImportError, OSError):
+        cfg = {}
+    sched = QuotaScheduler.from_config(cfg)
+    if sched is None:
+        print("Quota scheduler disabled (quota_rpm / quota_tpm not set)")
+        return 0
+    if cmd == "status":
+        print(json.dumps(sched.status(), indent=2))
+        return 0
+    if cmd == "reset":
+        sched.state_file.unlink(missing_ok=True)
+        print(f"Reset {sched.state_file}")
+        return 0
+    print("Usage: python3 quota_scheduler.py [status|reset]")
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
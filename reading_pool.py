@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Pre-generated reading pool: build tomorrow's readings off-peak, serve them instantly.
+
+A reading only depends on sign, date_anchor and a fresh spread, so the full
+pipeline can run ahead of time. `fill` tops up every sign for a date (tomorrow
+by default) during the configured off-peak window; `take` serves one pooled
+reading through the normal publish path (timestamped copies + latest pointer)
+and falls back to a live run when the pool is empty.
+
+Layout under <output_dir>/pool:
+  .building/<id>/                     pipeline runs in progress
+  <YYYY-MM-DD>/<Sign>/ready/<id>/     finished readings waiting to be served
+  <YYYY-MM-DD>/<Sign>/consumed/<id>/  served readings (pruned after pool_keep_days)
+  events.jsonl                        one line per take (hit / miss)
+
+Entries move between directories with os.rename, so concurrent takes race on
+the rename and each reading is served exactly once.
+
+Usage:
+  python3 reading_pool.py fill [--date YYYY-MM-DD] [--depth N] [--force]
+  python3 reading_pool.py take <SIGN> [--date YYYY-MM-DD]
+  python3 reading_pool.py status [--date YYYY-MM-DD]
+  python3 reading_pool.py watch
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import generate_prompts as gp
+
+SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+POOL_SUBDIR = "pool"
+BUILDING_SUBDIR = ".building"
+POOL_EVENTS = "events.jsonl"
+POOL_META = "pool.json"
+
+
+def pool_root(cfg: dict) -> Path:
+    return gp.HERE / cfg.get("output_dir", "output") / POOL_SUBDIR
+
+
+def date_anchor_for(day: date) -> str:
+    """CH01 date phrase for a pooled reading, e.g. "October 19"."""
+    return f"{day:%B} {day.day}"
+
+
+def in_offpeak(cfg: dict, now: datetime | None = None) -> bool:
+    """True inside pool_offpeak_hours [start, end) local time; windows may wrap midnight."""
+    start, end = (int(h) for h in cfg.get("pool_offpeak_hours", [1, 6]))
+    hour = (now or datetime.now()).hour
+    return start <= hour < end if start <= end else (hour >= start or hour < end)
+
+
+def _sign_dir(cfg: dict, day: date, sign: str) -> Path:
+    return pool_root(cfg) / day.isoformat() / sign
+
+
+def ready_entries(cfg: dict, day: date, sign: str) -> list[Path]:
+    """Pooled readings for sign/day, oldest first (served FIFO)."""
+    ready = _sign_dir(cfg, day, sign) / "ready"
+    if not ready.exists():
+        return []
+    return sorted((p for p in ready.iterdir() if p.is_dir()), key=lambda p: p.name)
+
+
+def build_one(cfg: dict, day: date, sign: str) -> Path | None:
+    """Run the full pipeline for sign/day into the pool; returns the ready entry or None on failure."""
+    building = pool_root(cfg) / BUILDING_SUBDIR
+    building.mkdir(parents=True, exist_ok=True)
+    stamp = gp.run_stamp()
+    run_dir = Path(tempfile.mkdtemp(prefix=f"{stamp}__{sign}__", dir=building))
+    anchor = date_anchor_for(day)
+    try:
+        result = gp.run_pipeline(dict(cfg, date_anchor=anchor), sign=sign, mode="generate",
+                                 run_dir=run_dir, publish=False)
+        if not gp.run_complete(run_dir, result["chapters"]):
+            print(f"[warn] Pool build for {sign} {day} incomplete — discarded")
+            shutil.rmtree(run_dir, ignore_errors=True)
+            return None
+        gp.atomic_write_text(run_dir / POOL_META, json.dumps({
+            "sign": sign, "date": day.isoformat(), "date_anchor": anchor, "built": stamp,
+            "spread": [card["title"] for card in gp.SPREAD_LOCK],
+        }, indent=2))
+        dst = _sign_dir(cfg, day, sign) / "ready" / run_dir.name
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.rename(run_dir, dst)
+        print(f"[ok] Pooled {sign} for {day} → {dst.name}")
+        return dst
+    except Exception as e:
+        print(f"[warn] Pool build for {sign} {day} failed: {e}")
+        shutil.rmtree(run_dir, ignore_errors=True)
+        return None
+
+
+def prune_pool(cfg: dict, today: date | None = None) -> None:
+    """Drop pool days older than pool_keep_days and stale .building dirs; latest-pointer runs are kept."""
+    root = pool_root(cfg)
+    if not root.exists():
+        return
+    base_out = root.parent
+    cutoff = (today or date.today()) - timedelta(days=int(cfg.get("pool_keep_days", 2)))
+    pinned = set()
+    latest = base_out / gp.LATEST_SUBDIR
+    if latest.exists():
+        for p in latest.glob("*.json"):
+            try:
+                pinned.add(json.loads(p.read_text(encoding="utf-8")).get("run_dir") or "")
+            except (OSError, ValueError):
+                continue
+    for d in root.iterdir():
+        try:
+            day = date.fromisoformat(d.name)
+        except ValueError:
+            continue
+        if day < cutoff:
+            prefix = gp._rel_to(d, base_out) + os.sep
+            if not any(p.startswith(prefix) for p in pinned):
+                shutil.rmtree(d, ignore_errors=True)
+    building = root / BUILDING_SUBDIR
+    if building.exists():
+        for d in building.iterdir():
+            if time.time() - d.stat().st_mtime > 86400:
+                shutil.rmtree(d, ignore_errors=True)
+
+
+def fill_pool(cfg: dict, day: date | None = None, depth: int | None = None) -> dict[str, int]:
+    """Top up every sign to depth ready readings for day (default: tomorrow); returns builds per sign."""
+    day = day or date.today() + timedelta(days=1)
+    depth = int(depth if depth is not None else cfg.get("pool_depth", 1))
+    prune_pool(cfg)
+    built = {}
+    for sign in SIGNS:
+        missing = depth - len(ready_entries(cfg, day, sign))
+        built[sign] = sum(build_one(cfg, day, sign) is not None for _ in range(max(0, missing)))
+    print(f"[ok] Pool fill for {day}: built {sum(built.values())} readings")
+    return built
+
+
+def record_event(cfg: dict, **event) -> None:
+    root = pool_root(cfg)
+    root.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(dict(event, ts=gp.run_stamp())) + "\n"
+    # one O_APPEND write per event, so concurrent takes never interleave lines
+    fd = os.open(root / POOL_EVENTS, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def take_reading(cfg: dict, sign: str, day: date | None = None) -> dict:
+    """Serve sign's reading for day from the pool (live generation when empty); returns the latest pointer.
+
+    A failed live run returns {"error": "incomplete", ...} with no "artifacts" and publishes nothing.
+    """
+    day = day or date.today()
+    base_out = pool_root(cfg).parent
+    consumed = _sign_dir(cfg, day, sign) / "consumed"
+    for entry in ready_entries(cfg, day, sign):
+        consumed.mkdir(parents=True, exist_ok=True)
+        claimed = consumed / entry.name
+        try:
+            os.rename(entry, claimed)  # atomic claim: exactly one taker wins
+        except FileNotFoundError:
+            continue
+        pointer = gp.publish_run(claimed, base_out, sign, gp.run_stamp())
+        gp.prune_runs(base_out, int(cfg.get("keep_runs", 20)))
+        record_event(cfg, sign=sign, date=day.isoformat(), hit=True)
+        print(f"[pool] hit: served {sign} {day} from {entry.name}")
+        return dict(pointer, source="pool")
+
+    record_event(cfg, sign=sign, date=day.isoformat(), hit=False)
+    print(f"[pool] miss: generating {sign} {day} live")
+    result = gp.run_pipeline(dict(cfg, date_anchor=date_anchor_for(day)), sign=sign, mode="generate")
+    if not result["published"] or not gp.run_complete(result["run_dir"], result["chapters"]):
+        print(f"[warn] Live generation for {sign} {day} incomplete — nothing served")
+        return {"sign": sign, "source": "live", "error": "incomplete", "run_dir": str(result["run_dir"])}
+    return dict(result["published"], source="live")
+
+
+def pool_status(cfg: dict, day: date | None = None) -> dict:
+    """Ready depth per sign for day and tomorrow, plus hit rate (overall and for day)."""
+    day = day or date.today()
+    tomorrow = day + timedelta(days=1)
+    events = []
+    p = pool_root(cfg) / POOL_EVENTS
+    if p.exists():
+        events = [json.loads(ln) for ln in p.read_text(encoding="utf-8").splitlines() if ln.strip()]
+
+    def rate(evs):
+        hits = sum(1 for e in evs if e.get("hit"))
+        return {"takes": len(evs), "hits": hits, "hit_rate": round(hits / len(evs), 3) if evs else None}
+
+    return {
+        "date": day.isoformat(),
+        "depth": {s: len(ready_entries(cfg, day, s)) for s in SIGNS},
+        "depth_tomorrow": {s: len(ready_entries(cfg, tomorrow, s)) for s in SIGNS},
+        "today": rate([e for e in events if e.get("date") == day.isoformat()]),
+        "overall": rate(events),
+    }
+
+
+def print_status(st: dict) -> None:
+    for label, key in (("today", "depth"), ("tomorrow", "depth_tomorrow")):
+        depth = st[key]
+        print(f"[pool] {label:<8} depth {sum(depth.values()):>3} | "
+              + " ".join(f"{s[:3]}={n}" for s, n in depth.items()))
+    for label in ("today", "overall"):
+        r = st[label]
+        pct = f"{100 * r['hit_rate']:.1f}%" if r["hit_rate"] is not None else "n/a"
+        print(f"[pool] {label:<8} hit rate {pct} ({r['hits']}/{r['takes']} takes)")
+
+
+def watch(cfg: dict) -> None:
+    """Scheduler mode: top up tomorrow's pool whenever the clock is inside the off-peak window."""
+    poll = float(cfg.get("pool_poll_minutes", 15)) * 60
+    print(f"[info] Pool watcher: off-peak hours {cfg.get('pool_offpeak_hours', [1, 6])}, polling every {poll / 60:g}m")
+    while True:
+        if in_offpeak(cfg):
+            fill_pool(cfg)
+        time.sleep(poll)
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pre-generated reading pool")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_fill = sub.add_parser("fill", help="Top up the pool for a date (default: tomorrow)")
+    p_fill.add_argument("--date", type=date.fromisoformat)
+    p_fill.add_argument("--depth", type=int, help="Ready readings per sign (default: pool_depth)")
+    p_fill.add_argument("--force", action="store_true", help="Run even outside pool_offpeak_hours")
+    p_take = sub.add_parser("take", help="Serve a reading for a sign (live generation when the pool is empty)")
+    p_take.add_argument("sign")
+    p_take.add_argument("--date", type=date.fromisoformat)
+    p_status = sub.add_parser("status", help="Pool depth and hit rate")
+    p_status.add_argument("--date", type=date.fromisoformat)
+    sub.add_parser("watch", help="Fill tomorrow's pool during off-peak hours, forever")
+    args = parser.parse_args()
+
+    cfg = gp.load_config()
+    if os.environ.get("WST_OUTPUT_DIR"):
+        cfg["output_dir"] = os.environ["WST_OUTPUT_DIR"]
+
+    if args.cmd == "fill":
+        if not args.force and not in_offpeak(cfg):
+            print(f"[info] Outside off-peak hours {cfg.get('pool_offpeak_hours', [1, 6])}; use --force to fill now")
+            return 0
+        fill_pool(cfg, args.date, args.depth)
+        print_status(pool_status(cfg, args.date))
+        return 0
+    if args.cmd == "take":
+        pointer = take_reading(cfg, args.sign, args.date)
+        print(json.dumps(pointer, indent=2))
+        return 0 if pointer.get("artifacts") else 1
+    if args.cmd == "status":
+        print_status(pool_status(cfg, args.date))
+        return 0
+    try:
+        watch(cfg)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
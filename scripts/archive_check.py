@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Archive round-trip check for postprocess_files.
+
+Builds a throwaway output dir of old timestamped readings and archives it in
+two passes within the same second (ages 360 then 10 days). Both segments must
+survive and every reading must stay readable via read_archived and restorable
+via unpack_segment, byte-for-byte. Timeline / chunk-manifest sidecars (current
+and legacy names) must be archived with their reading and restored with it.
+
+Usage:
+  python3 scripts/archive_check.py [--readings 24]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import apply_breaks as ab
+import postprocess_files as pp
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check two same-second archive runs both stay readable")
+    parser.add_argument("--readings", type=int, default=24, help="Readings per age band")
+    args = parser.parse_args()
+
+    base = Path(tempfile.mkdtemp(prefix="wst-archive-"))
+    out = base / "output"
+    out.mkdir()
+    now = datetime.now(timezone.utc)
+    expected = {}
+    for age, count in ((400, args.readings), (20, args.readings)):
+        for i in range(count):
+            stamp = (now - timedelta(days=age, minutes=i)).strftime("%Y-%m-%dT%H-%M-%S")
+            name = f"FULL_READING__Leo__{stamp}Z.txt"
+            expected[name] = f"reading {age}/{i}\n".encode("utf-8") * 50
+            (out / name).write_bytes(expected[name])
+            if i % 3 == 0:  # every third reading carries sidecars, current and legacy names
+                for side in ab.sidecar_paths(out / name):
+                    expected[Path(side).name] = f'{{"sidecar": "{Path(side).name}"}}'.encode("utf-8")
+                    Path(side).write_bytes(expected[Path(side).name])
+
+    problems = []
+    fixed_stamp = pp.iso_now()
+    real_iso_now, pp.iso_now = pp.iso_now, lambda: fixed_stamp  # force both runs into one second
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            first = pp.archive_old_readings(360, output_dir=out)
+            second = pp.archive_old_readings(10, output_dir=out)
+        if first is None or second is None or first == second:
+            problems.append(f"expected two distinct segments, got {first} and {second}")
+        for name, data in expected.items():
+            if (out / name).exists():
+                problems.append(f"{name} not archived")
+            elif pp.read_archived(name, out) != data:
+                problems.append(f"{name} not readable from the archive")
+        restore = base / "restore"
+        with contextlib.redirect_stdout(io.StringIO()):
+            for seg in (first, second):
+                if seg is not None:
+                    pp.unpack_segment(seg, dest=restore)
+        for name, data in expected.items():
+            if not (restore / name).exists() or (restore / name).read_bytes() != data:
+                problems.append(f"{name} not restored intact")
+        # restoring one reading by name brings its sidecars along
+        reading = next(n for n in expected if n.startswith("FULL_READING__"))
+        single = base / "single"
+        with contextlib.redirect_stdout(io.StringIO()):
+            pp.unpack_segment(pp.find_archived(reading, out), [reading], dest=single)
+        want = {Path(s).name for s in ab.sidecar_paths(reading) if Path(s).name in expected} | {reading}
+        got = {p.name for p in single.iterdir()}
+        if got != want:
+            problems.append(f"unpacking {reading} restored {sorted(got)}, expected {sorted(want)}")
+    finally:
+        pp.iso_now = real_iso_now
+        shutil.rmtree(base, ignore_errors=True)
+
+    for p in problems[:20]:
+        print(f"[FAIL] {p}")
+    if problems:
+        print(f"\n{len(problems)} archive problem(s)")
+        return 1
+    print(f"[ok] {len(expected)} files (readings + sidecars) in 2 same-second segments: all readable and restorable")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Hedged-request check against the local stub with injected slow responses.
+
+Runs --trials chapter requests through generate_prompts.hedged_completion with a
+fixed hedge delay while the stub makes --slow-rate of responses slow. From the
+stub's own counters each trial is classified and checked:
+  - fast primary:               no duplicate sent, no hedge counted
+  - slow primary, fast duplicate: hedge counted, the duplicate wins, and the
+                                chapter returns well before the slow response
+  - both slow:                  hedge counted (no latency win expected)
+
+Usage:
+  python3 scripts/hedge_check.py [--trials 20] [--slow-rate 0.5] [--slow-latency 4]
+                                 [--hedge-after 0.5] [--seed 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import generate_prompts as gp
+import stub_llm_server as stub
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check hedging against a stub with slow responses")
+    parser.add_argument("--trials", type=int, default=20)
+    parser.add_argument("--slow-rate", type=float, default=0.5)
+    parser.add_argument("--slow-latency", type=float, default=4.0)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--hedge-after", type=float, default=0.5, help="Static hedge delay in seconds")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    stub_cfg = stub.StubConfig(args.latency, 0.01, args.slow_rate, args.slow_latency)
+    server = stub.serve(0, stub_cfg, background=True)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    base = Path(tempfile.mkdtemp(prefix="wst-hedge-"))
+    cfg = dict(gp.load_config(), output_dir=str(base), quota_rpm=0, quota_tpm=0, candidates=1,
+               hedge_requests=True, hedge_after_seconds=args.hedge_after, hedge_min_samples=10 ** 9)
+    stats_file = gp.stats_dir(cfg) / "hedge_stats.json"
+
+    problems, kinds, wins, saved = [], {"fast": 0, "hedge_win": 0, "both_slow": 0}, 0, []
+    try:
+        for trial in range(args.trials):
+            before = stub_cfg.snapshot()
+            prev = json.loads(stats_file.read_text()) if stats_file.exists() else {}
+            t0 = time.monotonic()
+            with contextlib.redirect_stdout(io.StringIO()):
+                gp.hedged_completion(cfg, f"hedge check {trial}", "stub", 1)
+            elapsed = time.monotonic() - t0
+            after = stub_cfg.snapshot()
+            stats = json.loads(stats_file.read_text())
+            sent = after["requests"] - before["requests"]
+            slow = after["slow"] - before["slow"]
+            hedged = stats["hedged"] - prev.get("hedged", 0)
+            won = stats["hedge_wins"] - prev.get("hedge_wins", 0)
+
+            if slow == 0:
+                kinds["fast"] += 1
+                if sent != 1 or hedged:
+                    problems.append(f"trial {trial}: fast primary but {sent} requests / hedged={hedged}")
+            elif sent == 2 and slow == 1:
+                kinds["hedge_win"] += 1
+                wins += won
+                saved.append(args.slow_latency - elapsed)
+                if not hedged or not won:
+                    problems.append(f"trial {trial}: slow primary, fast duplicate but hedged={hedged} won={won}")
+                if elapsed >= args.slow_latency * 0.75:
+                    problems.append(f"trial {trial}: hedged chapter took {elapsed:.2f}s "
+                                    f"(slow response is {args.slow_latency:g}s)")
+            elif sent == 2 and slow == 2:
+                kinds["both_slow"] += 1
+                if not hedged:
+                    problems.append(f"trial {trial}: slow primary but no hedge counted")
+            else:
+                problems.append(f"trial {trial}: unexpected {sent} requests, {slow} slow")
+    finally:
+        server.shutdown()
+        shutil.rmtree(base, ignore_errors=True)
+
+    print(f"[hedge-check] {args.trials} trials: {kinds['fast']} fast, {kinds['hedge_win']} rescued by the duplicate, "
+          f"{kinds['both_slow']} both slow")
+    if saved:
+        print(f"[hedge-check] duplicate won {wins}/{kinds['hedge_win']}; "
+              f"mean latency saved {sum(saved) / len(saved):.2f}s vs the {args.slow_latency:g}s slow response")
+    elif args.slow_rate > 0:
+        problems.append("no trial had a slow primary with a fast duplicate; raise --trials")
+    for p in problems:
+        print(f"[FAIL] {p}")
+    if problems:
+        return 1
+    print("[ok] hedging behaves as expected")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
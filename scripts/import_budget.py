@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Cold-import budget check for the pipeline modules.
+
+Each module is imported in a fresh interpreter (best of --repeat) and must:
+  - finish under --budget seconds,
+  - print nothing (no import-time side effects),
+  - leave heavy optional dependencies (yaml, openai, asyncio, ...) unloaded.
+
+Usage:
+  python3 scripts/import_budget.py [--budget 0.15] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ["wst_api", "generate_prompts", "apply_breaks", "postprocess_files", "quota_scheduler", "reading_pool"]
+LAZY_DEPS = ["yaml", "openai", "httpx", "asyncio", "concurrent.futures", "argparse"]
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+sys.stderr.write(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def probe(module: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, lazy=LAZY_DEPS)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    data = json.loads(proc.stderr.strip().splitlines()[-1])
+    data["stdout"] = proc.stdout
+    return data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check cold-import time and side effects")
+    parser.add_argument("--budget", type=float, default=0.15, help="Max cold import seconds per module")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module (best time counts)")
+    args = parser.parse_args()
+
+    failures = 0
+    for module in MODULES:
+        runs = [probe(module) for _ in range(args.repeat)]
+        best = min(r["elapsed"] for r in runs)
+        problems = []
+        if best > args.budget:
+            problems.append(f"{best * 1000:.0f}ms > {args.budget * 1000:.0f}ms budget")
+        if runs[0]["stdout"]:
+            problems.append(f"prints on import: {runs[0]['stdout'].strip()[:80]!r}")
+        if runs[0]["loaded"]:
+            problems.append(f"eagerly imports {', '.join(runs[0]['loaded'])}")
+        status = "FAIL" if problems else "ok"
+        print(f"[{status}] {module:<18} {best * 1000:7.1f}ms" + (f"  — {'; '.join(problems)}" if problems else ""))
+        failures += bool(problems)
+
+    if failures:
+        print(f"\n{failures} module(s) over budget or with import side effects")
+        return 1
+    print("\nAll modules within import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
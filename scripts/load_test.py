@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test: N concurrent generate_prompts.py pipelines against a local stub.
+
+Starts stub_llm_server on a free port and runs full pipelines (prompts,
+generation, stitching, breaks, publish) as separate processes with
+WST_MODE=generate and WST_BREAKS_MODE=with_breaks. Everything is written
+under a throwaway output dir, so real readings, latest pointers and stats
+are not touched. The report covers readings/minute, per-stage latency
+percentiles (from each run's timings.json), CPU and peak RSS per pipeline,
+what the stub injected and a breakdown of failures.
+
+Usage:
+  python3 scripts/load_test.py [--concurrency 4] [--runs 8] [--latency 0.3] [--jitter 0.1]
+                               [--dist gauss|lognormal|exp] [--tokens-per-second 0]
+                               [--error-rate 0.0] [--rate-limit-rate 0.0]
+                               [--slow-rate 0.0] [--slow-latency 20]
+                               [--keep] [--json report.json]
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import argparse
+import json
+import math
+import os
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import stub_llm_server as stub
+
+SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+STAGES = ("prompts", "generate", "chapter", "stitch", "breaks", "publish", "total")
+CHAPTER_FAIL_RE = re.compile(r"^\[warn\] (?:API generation failed for CH\d\d|CH\d\d generation error): (.*)$",
+                             re.MULTILINE)
+
+
+def classify(message: str) -> str:
+    m = message.lower()
+    if "429" in m or "rate limit" in m:
+        return "rate_limited"
+    if "500" in m or "internal" in m:
+        return "server_error"
+    if "timed out" in m or "timeout" in m:
+        return "timeout"
+    if "connection" in m:
+        return "connection"
+    return message.split(":")[0][:60] or "unknown"
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = max(0, math.ceil(pct * len(ordered) / 100.0) - 1)  # nearest rank
+    return ordered[min(k, len(ordered) - 1)]
+
+
+def run_pipeline(idx: int, base: Path, env: dict) -> dict:
+    """Run one full pipeline as a child process; returns timings, rusage and failures."""
+    sign = SIGNS[idx % len(SIGNS)]
+    run_dir = base / "load_runs" / f"{idx:04d}_{sign}"
+    run_dir.mkdir(parents=True)
+    log = run_dir / "pipeline.log"
+    env = dict(env, WST_SIGN=sign, WST_RUN_DIR=str(run_dir))
+
+    t0 = time.monotonic()
+    with open(log, "w", encoding="utf-8") as out:
+        proc = subprocess.Popen([sys.executable, str(ROOT / "generate_prompts.py")],
+                                cwd=ROOT, env=env, stdout=out, stderr=subprocess.STDOUT)
+        # wait4 gives this child's own CPU time and peak RSS
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+    wall = time.monotonic() - t0
+
+    result = {
+        "run": idx, "sign": sign, "exit": proc.returncode, "wall": wall,
+        "cpu": usage.ru_utime + usage.ru_stime,
+        "max_rss_mb": usage.ru_maxrss / 1024.0,  # KiB on Linux
+        "timings": {}, "failures": [],
+    }
+    timings = run_dir / "timings.json"
+    if timings.exists():
+        result["timings"] = json.loads(timings.read_text(encoding="utf-8"))
+    text = log.read_text(encoding="utf-8", errors="replace")
+    for m in CHAPTER_FAIL_RE.finditer(text):
+        result["failures"].append(classify(m.group(1)))
+    if proc.returncode != 0:
+        result["failures"].append(f"exit_{proc.returncode}")
+    elif not (run_dir / "FULL_READING_with_breaks.txt").exists():
+        result["failures"].append("no_with_breaks_output")
+    result["ok"] = proc.returncode == 0 and not result["failures"]
+    return result
+
+
+def build_report(results: list[dict], wall: float, stub_stats: dict, args) -> dict:
+    samples = {s: [] for s in STAGES}
+    for r in results:
+        t = r["timings"]
+        for stage in ("prompts", "generate", "stitch", "breaks", "publish"):
+            if stage in t:
+                samples[stage].append(t[stage])
+        samples["chapter"].extend(t.get("chapters", {}).values())
+        samples["total"].append(r["wall"])
+
+    failures: dict[str, int] = {}
+    for r in results:
+        for f in r["failures"]:
+            failures[f] = failures.get(f, 0) + 1
+
+    ok = sum(1 for r in results if r["ok"])
+    cpu = [r["cpu"] for r in results]
+    rss = [r["max_rss_mb"] for r in results]
+    harness = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "concurrency": args.concurrency,
+        "runs": len(results),
+        "completed": ok,
+        "wall_seconds": round(wall, 2),
+        "readings_per_minute": round(60.0 * ok / wall, 2) if wall else 0.0,
+        "stages": {
+            s: {f"p{p}": round(percentile(v, p), 3) for p in (50, 95, 99)} | {"n": len(v)}
+            for s, v in samples.items() if v
+        },
+        "pipeline_cpu_seconds": {"mean": round(sum(cpu) / len(cpu), 3), "max": round(max(cpu), 3)} if cpu else {},
+        "pipeline_max_rss_mb": {"p50": round(percentile(rss, 50), 1), "max": round(max(rss), 1)} if rss else {},
+        "harness_cpu_seconds": round(harness.ru_utime + harness.ru_stime, 3),
+        "stub": stub_stats,
+        "failures": failures,
+    }
+
+
+def print_report(rep: dict) -> None:
+    print(f"\n[load] {rep['completed']}/{rep['runs']} pipelines ok at concurrency {rep['concurrency']} "
+          f"in {rep['wall_seconds']}s — {rep['readings_per_minute']} readings/min")
+    print(f"[load] {'stage':<9} {'n':>5} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for stage, st in rep["stages"].items():
+        print(f"[load] {stage:<9} {st['n']:>5} {st['p50']:>8.3f}s {st['p95']:>8.3f}s {st['p99']:>8.3f}s")
+    if rep["pipeline_cpu_seconds"]:
+        print(f"[load] pipeline CPU mean={rep['pipeline_cpu_seconds']['mean']}s max={rep['pipeline_cpu_seconds']['max']}s | "
+              f"RSS p50={rep['pipeline_max_rss_mb']['p50']}MB max={rep['pipeline_max_rss_mb']['max']}MB | "
+              f"harness+stub CPU={rep['harness_cpu_seconds']}s")
+    s = rep["stub"]
+    print(f"[load] stub: {s['requests']} requests, {s['slow']} slow, "
+          f"{s['rate_limited_429']} x 429, {s['errors_500']} x 500 injected")
+    if rep["failures"]:
+        print("[load] failures: " + ", ".join(f"{k}={v}" for k, v in sorted(rep["failures"].items())))
+    else:
+        print("[load] failures: none")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test full pipelines against a local stub LLM")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pipelines running at once")
+    parser.add_argument("--runs", type=int, default=None, help="Total pipelines (default: 2 x concurrency)")
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--dist", choices=stub.LATENCY_DISTS, default="gauss")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-latency", type=float, default=20.0)
+    parser.add_argument("--keep", action="store_true", help="Keep the throwaway output dir")
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON")
+    args = parser.parse_args()
+    runs = args.runs or 2 * args.concurrency
+
+    cfg = stub.StubConfig(args.latency, args.jitter, args.slow_rate, args.slow_latency,
+                          dist=args.dist, tokens_per_second=args.tokens_per_second,
+                          error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate)
+    server = stub.serve(0, cfg, background=True)
+    port = server.server_address[1]
+    base = Path(tempfile.mkdtemp(prefix="wst-load-"))
+    env = dict(os.environ,
+               OPENAI_BASE_URL=f"http://127.0.0.1:{port}/v1", OPENAI_API_KEY="stub",
+               WST_MODE="generate", WST_BREAKS_MODE="with_breaks",
+               WST_OUTPUT_DIR=str(base / "output"), WST_QUOTA_FILE=str(base / "quota.json"))
+    env.pop("WST_CHAPTER", None)
+    print(f"[load] stub on :{port}, {runs} pipelines x concurrency {args.concurrency}, output {base}")
+
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda i: run_pipeline(i, base, env), range(runs)))
+    wall = time.monotonic() - t0
+    server.shutdown()
+
+    rep = build_report(results, wall, cfg.snapshot(), args)
+    print_report(rep)
+    if args.json:
+        args.json.write_text(json.dumps(rep, indent=2), encoding="utf-8")
+        print(f"[ok] Wrote {args.json}")
+    if args.keep:
+        print(f"[info] Kept {base}")
+    else:
+        shutil.rmtree(base, ignore_errors=True)
+    return 0 if rep["completed"] == rep["runs"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Round-trip check for the incremental re-break.
+
+Re-breaking a reading with no edits must return the previous broken text
+byte-for-byte (and rebuild nothing), otherwise reviewed breaks and rendered
+chunks get thrown away. Runs every stitched reading under output/ through
+add_breaks_to_text with several seeds, then rebreak_incremental on the result.
+
+Usage:
+  python3 scripts/rebreak_roundtrip.py [--seeds 5] [--dir output]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import apply_breaks as ab
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check rebreak_incremental(x, add_breaks_to_text(x)) is a no-op")
+    parser.add_argument("--seeds", type=int, default=5, help="Random seeds per reading")
+    parser.add_argument("--dir", type=Path, default=ROOT / "output", help="Directory with FULL_READING__*.txt")
+    args = parser.parse_args()
+
+    readings = sorted(p for p in args.dir.glob("FULL_READING__*.txt"))
+    if not readings:
+        print(f"[warn] No FULL_READING__*.txt under {args.dir}")
+        return 1
+
+    failures = 0
+    for path in readings:
+        plain = path.read_text(encoding="utf-8")
+        for seed in range(args.seeds):
+            random.seed(seed)
+            previous = ab.add_breaks_to_text(plain)
+            text, stats = ab.rebreak_incremental(plain, previous)
+            if text != previous or stats["gaps_rebuilt"] or stats["paragraphs_touched"]:
+                failures += 1
+                print(f"[FAIL] {path.name} seed={seed}: gaps_rebuilt={stats['gaps_rebuilt']} "
+                      f"paragraphs_touched={stats['paragraphs_touched']} identical={text == previous}")
+
+    total = len(readings) * args.seeds
+    if failures:
+        print(f"\n{failures}/{total} round trips changed the previous breaks")
+        return 1
+    print(f"[ok] {total} round trips ({len(readings)} readings x {args.seeds} seeds) unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
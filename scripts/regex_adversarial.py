@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Adversarial / fuzz timing suite for the text-processing regexes.
+
+Model output is untrusted: one malformed completion (a 1 MB line, thousands of
+unclosed "[" lines, walls of break tags) must not stall a worker. Each case runs
+at size n and 4n and fails if the large run exceeds TIME_BOUND_S or grows
+super-linearly (ratio > MAX_GROWTH; linear is ~4, quadratic ~16). A random fuzz
+pass then pushes mixed junk through the full post-processing chain.
+
+Usage:
+  python3 scripts/regex_adversarial.py [--scale 1.0] [--fuzz 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import generate_prompts as gp
+import apply_breaks as ab
+
+TIME_BOUND_S = 2.0
+MAX_GROWTH = 8.0
+BASE_N = 25_000
+
+
+def _timed(fn, arg) -> float:
+    best = float("inf")
+    for _ in range(2):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _cases():
+    reveal = 'The Moon, reversed. <break time="3.4s" /> Oh wow. <break time="1.1s" /> '
+    return [
+        # generate_prompts.py
+        ("CARD_NAME_RE long line", gp._insert_between_cards, lambda n: "A" + "b" * (n * 20)),
+        ("CARD_NAME_RE many lines", gp._insert_between_cards, lambda n: "Ab, reversed\n" * n),
+        ("micro-break split, no tags", gp._sprinkle_micro_breaks, lambda n: "Hi. " * n),
+        ("micro-break split, open '<'", gp._sprinkle_micro_breaks, lambda n: "Hi. " * n + "<"),
+        ("micro-break split, tags", gp._sprinkle_micro_breaks, lambda n: 'Hi. <break time="1s" /> ' * n),
+        ("log stripper, unclosed [", gp.sanitize_for_output, lambda n: "[abc\n" * n),
+        ("log stripper, [a] chains", gp.sanitize_for_output, lambda n: "[a] " * n + "\n"),
+        ("ruler lines, long spaces", gp.sanitize_for_output, lambda n: " " * (n * 4) + "x"),
+        ("meta scrub, unclosed [STATE:", gp.scrub_bracketed_meta, lambda n: "[STATE:x\n" * n),
+        ("closer, newline wall", gp.sanitize_trailing_closer, lambda n: "a" + "\n" * (n * 4) + "b"),
+        ("closer, spaces then OK.", gp.sanitize_trailing_closer, lambda n: "a" + " \n" * n + "OK."),
+        ("oh-wow, no match", gp.rotate_oh_wow, lambda n: "Line one.\n" * n),
+        ("oh-wow, near miss", gp.rotate_oh_wow, lambda n: "Yes, Oh wow.\n" * n),
+        ("break ruleset, long line", lambda t: gp.apply_break_ruleset(t), lambda n: "Word " * (n * 4)),
+        # apply_breaks.py
+        ("pattern1, repeated breaks", ab.sanitize_break_combinations, lambda n: '<break time="3s" /> ' * n),
+        ("pattern1, card + whitespace", ab.sanitize_break_combinations,
+         lambda n: "The Moon." + " " * (n * 4) + '<break time="3s" /> Oh wow.' + " " * (n * 4) + 'x<break time="1s" />'),
+        ("pattern1, 'The' walls", ab.sanitize_break_combinations, lambda n: "The " * n + '<break time="3s" />' * 2),
+        ("pattern1, real reveals", ab.sanitize_break_combinations, lambda n: reveal * (n // 10)),
+        ("normalize, unterminated tags", ab.normalize_existing_breaks, lambda n: "<break time=" + "a/" * n),
+        ("add_breaks, repeated tags", ab.add_breaks_to_text, lambda n: '<break time="1s" /> ' * (n // 4)),
+        ("add_breaks, one huge line", ab.add_breaks_to_text, lambda n: "word " * (n * 2)),
+        ("chunker, repeated reveals", ab.chunk_for_tts, lambda n: reveal * (n // 10)),
+    ]
+
+
+def run_cases(scale: float) -> list[str]:
+    failures = []
+    n = max(100, int(BASE_N * scale))
+    for name, fn, make in _cases():
+        small = _timed(fn, make(n))
+        large = _timed(fn, make(4 * n))
+        growth = large / small if small > 1e-4 else 1.0
+        ok = large <= TIME_BOUND_S and growth <= MAX_GROWTH
+        print(f"{'ok  ' if ok else 'FAIL'} {name:32s} n={n:>7d} {small * 1000:8.1f}ms  4n={large * 1000:8.1f}ms  x{growth:4.1f}")
+        if not ok:
+            failures.append(name)
+    return failures
+
+
+FUZZ_TOKENS = [
+    "The Moon, reversed.", "Queen of Cups.", "Oh wow.", "Hm.", "Whoa.", "OK.", "Okay.",
+    '<break time="3.4s" />', '<break time="0.5s" />', "<break />", "[break]", "<", "[", "]",
+    "[STATE: x", "[ok]", "[CH01]", "---", "—", ". ", ".", "\n", "\n\n", " ", "\t", "Wait,",
+    "Now, if this resonated", "word", "You know,",
+]
+
+
+def run_fuzz(iterations: int, seed: int = 1234) -> list[str]:
+    rng = random.Random(seed)
+    failures = []
+    for i in range(iterations):
+        text = "".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(0, 4000)))
+        t0 = time.perf_counter()
+        s = gp.sanitize_for_output(gp.scrub_bracketed_meta(gp.rotate_oh_wow(gp.sanitize_trailing_closer(text))))
+        gp.apply_break_ruleset(s)
+        with_breaks = ab.add_breaks_to_text(s, [])
+        chunks = ab.chunk_for_tts(with_breaks, max_chars=500)
+        elapsed = time.perf_counter() - t0
+        if with_breaks.strip() and "".join(c["text"] for c in chunks) != with_breaks:
+            failures.append(f"fuzz#{i}: chunks do not reassemble the input")
+        if elapsed > TIME_BOUND_S:
+            failures.append(f"fuzz#{i}: {elapsed:.2f}s")
+    print(f"{'ok  ' if not failures else 'FAIL'} fuzz {iterations} random documents")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Adversarial timing suite for text-processing regexes")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply base input sizes")
+    parser.add_argument("--fuzz", type=int, default=200, help="Random documents to run through the full chain")
+    args = parser.parse_args()
+
+    random.seed(0)
+    failures = run_cases(args.scale) + run_fuzz(args.fuzz)
+    if failures:
+        print(f"\n{len(failures)} failing: {', '.join(failures)}")
+        return 1
+    print("\nAll regex paths stayed within bounds.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
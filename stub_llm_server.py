@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Local OpenAI-compatible stub for exercising the generation pipeline offline.
+
+Serves POST /v1/chat/completions with a canned chapter, configurable latency
+distribution, completion token rate and injected slow / 429 / 500 responses, so
+hedging, quota handling and throughput can be checked without API calls or spend.
+
+Usage:
+  python3 stub_llm_server.py [--port 8089] [--latency 0.3] [--jitter 0.1]
+                             [--dist gauss|lognormal|exp] [--tokens-per-second 0]
+                             [--slow-rate 0.1] [--slow-latency 20]
+                             [--error-rate 0.0] [--rate-limit-rate 0.0]
+
+Then point the generator at it:
+  OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=stub python3 generate_prompts.py
+"""
+
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+
+STUB_PARAGRAPH = (
+    "Okay so I'm seeing a lot of back and forth here. They texted, then went quiet again. "
+    "You already knew this, right? You're done waiting on them. Yeah."
+)
+
+CARD_IN_PROMPT_RE = re.compile(r"^<CARD (\d)> = (.+)$", re.MULTILINE)
+
+
+LATENCY_DISTS = ("gauss", "lognormal", "exp")
+
+
+class StubConfig:
+    """Latency/error knobs shared by all handler threads."""
+
+    def __init__(self, latency=0.3, jitter=0.1, slow_rate=0.0, slow_latency=20.0, paragraphs=6,
+                 dist="gauss", tokens_per_second=0.0, error_rate=0.0, rate_limit_rate=0.0,
+                 retry_after=1.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.paragraphs = paragraphs
+        self.dist = dist
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.slow = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    def next_delay(self) -> float:
+        with self.lock:
+            self.requests += 1
+            if random.random() < self.slow_rate:
+                self.slow += 1
+                return self.slow_latency
+        if self.dist == "lognormal":
+            # mean/std of the resulting distribution match latency/jitter
+            var = math.log(1 + (self.jitter / self.latency) ** 2) if self.latency > 0 else 0.0
+            return random.lognormvariate(math.log(max(self.latency, 1e-6)) - var / 2, math.sqrt(var))
+        if self.dist == "exp":
+            return random.expovariate(1.0 / self.latency) if self.latency > 0 else 0.0
+        return max(0.0, random.gauss(self.latency, self.jitter))
+
+    def next_fault(self) -> int | None:
+        """HTTP status to inject for this request (429 or 500), or None."""
+        r = random.random()
+        with self.lock:
+            if r < self.rate_limit_rate:
+                self.rate_limited += 1
+                return 429
+            if r < self.rate_limit_rate + self.error_rate:
+                self.errors += 1
+                return 500
+        return None
+
+    def generation_seconds(self, completion_tokens: int) -> float:
+        return completion_tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {"requests": self.requests, "slow": self.slow,
+                    "errors_500": self.errors, "rate_limited_429": self.rate_limited}
+
+
+def build_completion(prompt: str, paragraphs: int) -> str:
+    """Canned chapter; names the first card slot from a prefix_cache prompt when present."""
+    body = "\n\n".join([STUB_PARAGRAPH] * paragraphs)
+    cards = CARD_IN_PROMPT_RE.findall(prompt)
+    if cards:
+        body = f"{cards[0][1]}. Whoa.\n\n" + body
+    return body
+
+
+def make_handler(cfg: StubConfig):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):  # keep stdout clean for the generator's logs
+            pass
+
+        def _send_json(self, code: int, payload: dict, headers: dict | None = None) -> None:
+            data = json.dumps(payload).encode("utf-8")
+            try:
+                self.send_response(code)
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client hung up (e.g. a cancelled hedge)
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": "not found"}})
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            req = json.loads(self.rfile.read(length) or b"{}")
+            prompt = "\n".join(m.get("content") or "" for m in req.get("messages", []))
+            time.sleep(cfg.next_delay())
+            fault = cfg.next_fault()
+            if fault == 429:
+                self._send_json(429, {"error": {"message": "Rate limit reached (stub)", "type": "requests"}},
+                                {"Retry-After": f"{cfg.retry_after:g}"})
+                return
+            if fault == 500:
+                self._send_json(500, {"error": {"message": "Internal error (stub)", "type": "server_error"}})
+                return
+
+            n = int(req.get("n") or 1)
+            model = req.get("model", "stub")
+            choices = []
+            for i in range(n):
+                text = build_completion(prompt, cfg.paragraphs)
+                choices.append({
+                    "index": i,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": text},
+                })
+            prompt_tokens = len(prompt) // 4
+            completion_tokens = sum(len(c["message"]["content"]) // 4 for c in choices)
+            time.sleep(cfg.generation_seconds(completion_tokens))
+            self._send_json(200, {
+                "id": f"chatcmpl-stub-{cfg.requests}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": choices,
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                    "prompt_tokens_details": {"cached_tokens": 0},
+                },
+            })
+
+    return Handler
+
+
+def serve(port: int = 8089, cfg: StubConfig | None = None, background: bool = False) -> ThreadingHTTPServer:
+    """Start the stub; with background=True it runs on a daemon thread and the server is returned."""
+    # port=0 picks a free port; read it back from server.server_address
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(cfg or StubConfig()))
+    server.daemon_threads = True
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    else:
+        server.serve_forever()
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub server")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.3, help="Mean response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="Latency standard deviation in seconds")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of requests that are slow (0.0-1.0)")
+    parser.add_argument("--slow-latency", type=float, default=20.0, help="Latency of injected slow responses")
+    parser.add_argument("--dist", choices=LATENCY_DISTS, default="gauss", help="Latency distribution")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0,
+                        help="Completion token rate added on top of latency (0 = instant)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    args = parser.parse_args()
+
+    cfg = StubConfig(args.latency, args.jitter, args.slow_rate, args.slow_latency,
+                     dist=args.dist, tokens_per_second=args.tokens_per_second,
+                     error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate)
+    print(f"[stub] listening on http://127.0.0.1:{args.port}/v1")
+    try:
+        serve(args.port, cfg)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
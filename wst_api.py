@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Importable API for the reading pipeline (the CLIs wrap the same functions).
+
+Importing this module is cheap and has no side effects; the pipeline modules,
+yaml and openai load on first call. One reading at a time per process — run
+concurrent readings as separate processes.
+
+    import wst_api
+    cfg = wst_api.load_config()
+    result = wst_api.run_pipeline(cfg, sign="Leo", mode="generate", breaks_mode="with_breaks")
+
+Or step by step:
+
+    prompts = wst_api.render_prompts(cfg, run_dir)
+    wst_api.generate(cfg, run_dir, prompts)
+    stitched = wst_api.stitch(run_dir)
+    text, timeline = wst_api.apply_breaks(stitched.read_text())
+    wst_api.archive(30)
+    wst_api.read_archived("FULL_READING__Leo__2025-10-01T09-00-00Z.txt")
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def load_config(path: Path | str | None = None) -> dict:
+    """Parse config.yaml (or path)."""
+    import generate_prompts as gp
+    return gp.load_config(path)
+
+
+def render_prompts(cfg: dict, out_dir: Path | str, chapters: list[int] | None = None) -> dict[int, Path]:
+    """Draw a fresh spread and write CHxx_prompt.txt files; returns {chapter: path}."""
+    import generate_prompts as gp
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    gp.reset_spread()
+    return gp.render_prompts(cfg, out_dir, chapters)
+
+
+def generate(cfg: dict, out_dir: Path | str, prompts_by_ch: dict[int, Path]) -> dict[int, Path | None]:
+    """Generate chapters for prompts from render_prompts(); failed chapters map to None."""
+    import generate_prompts as gp
+    return gp.generate_chapters(cfg, Path(out_dir), prompts_by_ch)
+
+
+def stitch(out_dir: Path | str, chapters: list[int] | None = None, breaks_mode: str = "none") -> Path:
+    """Stitch chapters into FULL_READING.txt (generated text when every chapter has it)."""
+    import generate_prompts as gp
+    return gp.stitch_reading(Path(out_dir), chapters or [1, 2, 3, 4, 5, 6, 7], breaks_mode)
+
+
+def apply_breaks(text: str) -> tuple[str, list[dict]]:
+    """Apply the break ruleset to a stitched reading; returns (text, timeline events)."""
+    import apply_breaks as ab
+    timeline = []
+    return ab.add_breaks_to_text(text, timeline), timeline
+
+
+def rebreak(edited_text: str, previous_with_breaks: str) -> tuple[str, dict]:
+    """Re-break an edited reading, keeping the previous breaks wherever the text is unchanged."""
+    import apply_breaks as ab
+    return ab.rebreak_incremental(edited_text, previous_with_breaks)
+
+
+def apply_breaks_file(input_file: Path | str, output_file: Path | str) -> Path:
+    """apply_breaks.py on files: writes output_file and its timeline__<stem>.json sidecar."""
+    import apply_breaks as ab
+    return Path(ab.apply_breaks_to_file(str(input_file), str(output_file)))
+
+
+def archive(max_age_days: int | None = None, output_dir: Path | str | None = None) -> Path | None:
+    """Pack timestamped readings older than max_age_days into an archive segment."""
+    import postprocess_files as pp
+    return pp.archive_old_readings(
+        pp.ARCHIVE_MAX_AGE_DAYS if max_age_days is None else max_age_days,
+        Path(output_dir) if output_dir else pp.OUTPUT_DIR,
+    )
+
+
+def read_archived(name: str, output_dir: Path | str | None = None) -> str | None:
+    """Text of an archived reading (None when no segment under output_dir/archive holds it)."""
+    import postprocess_files as pp
+    data = pp.read_archived(name, Path(output_dir) if output_dir else pp.OUTPUT_DIR)
+    return data.decode("utf-8") if data is not None else None
+
+
+def unpack(segment: Path | str, names: list[str] | None = None,
+           output_dir: Path | str | None = None) -> list[Path]:
+    """Restore readings from an archive segment back into output_dir (all of them when names is empty)."""
+    import postprocess_files as pp
+    return pp.unpack_segment(Path(segment), names, output_dir=Path(output_dir) if output_dir else pp.OUTPUT_DIR)
+
+
+def run_pipeline(cfg: dict | None = None, **kwargs) -> dict:
+    """Full run (prompts, generate, stitch, breaks, publish); see generate_prompts.run_pipeline."""
+    import generate_prompts as gp
+    return gp.run_pipeline(cfg, **kwargs)
+
+
+def take_reading(cfg: dict, sign: str) -> dict:
+    """Serve today's reading for sign from the pre-generated pool, generating live when empty."""
+    import reading_pool
+    return reading_pool.take_reading(cfg, sign)